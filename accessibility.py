@@ -106,6 +106,7 @@ class AccessibilitySettings:
         self.colorblind_mode_index = 0  # Default: Off
         self.outline_characters = False  # Add outlines to characters
         self.pattern_platforms = False   # Add patterns to platforms
+        self.version = 0  # Bumped on every mode change so renderers can invalidate caches
     
     @property
     def colorblind_mode(self):
@@ -128,6 +129,7 @@ class AccessibilitySettings:
             Name of the new mode
         """
         self.colorblind_mode_index = (self.colorblind_mode_index + direction) % len(self.MODES)
+        self.version += 1
         self._apply_mode()
         return self.colorblind_mode
     
@@ -5,7 +5,7 @@ from playgrounds import PlaygroundManager
 from player import Player
 from particles import ParticleSystem
 
-from ui import ControlPanel, draw_level_selector, draw_selection_overlay, draw_pause_screen
+from ui import ControlPanel, draw_selection_overlay, draw_pause_screen, draw_controller_status
 from keybindings import KeyBindings
 from controller import ControllerInput
 from sound_manager import SoundManager
@@ -32,7 +32,7 @@ def draw_background(screen):
             g = top_color[1] * (1-p) + bottom_color[1] * p
             b = top_color[2] * (1-p) + bottom_color[2] * p
             draw_background.surface.set_at((0, y), (int(r), int(g), int(b)))
-        draw_background.surface = pygame.transform.scale(draw_background.surface, (width, height))
+        draw_background.surface = pygame.transform.scale(draw_background.surface, (width, height)).convert()
         draw_background.cache_key = cache_key
     
     screen.blit(draw_background.surface, (0, 0))
@@ -61,6 +61,10 @@ def main():
     # Character List for Selection
     from character_profiles import CHARACTERS, MARIO, SUPER_MEAT_BOY, ZELDA_LINK, MADELINE, N_NINJA
     char_list = [MARIO, SUPER_MEAT_BOY, ZELDA_LINK, MADELINE, N_NINJA]
+    
+    # Selection overlay entries, built once rather than every frame the overlay is up
+    char_items = [{'name': c.name, 'color': c.color} for c in char_list]
+    level_items = [{'name': n} for n in PlaygroundManager.SHORT_NAMES]
 
     player = Player((200, SCREEN_HEIGHT - 200), playground, MARIO, sound_manager)
     player.particle_system = particle_system
@@ -265,7 +269,7 @@ def main():
             elif abs(dpad_y) > 0: change = -dpad_y
             
             if change != 0 and selection_cooldown == 0:
-                selection_index = (selection_index + change) % 6 # Fixed count (0-5)
+                selection_index = (selection_index + change) % len(level_items)
                 selection_cooldown = 12
 
         else:
@@ -304,27 +308,13 @@ def main():
         
         # Draw Controller Status (bottom-left per mockup)
         if controller.connected:
-            from ui_theme import font_text, get_colors, MARGIN_LEFT
-            colors = get_colors()
-            status_text = f"Wireless Controller: Connected"
-            
-            controller_text = font_text().render(status_text, True, colors['text_dim'])
-            screen.blit(controller_text, (MARGIN_LEFT, SCREEN_HEIGHT - 30))
+            draw_controller_status(screen)
 
         # Draw Selection Overlay
         if selection_mode == "CHARACTER":
-            items = [{'name': c.name, 'color': c.color} for c in char_list]
-            draw_selection_overlay(screen, "CHARACTER", selection_index, items)
+            draw_selection_overlay(screen, "CHARACTER", selection_index, char_items)
         elif selection_mode == "LEVEL":
-            # Playground names aren't easily accessible, let's map them
-            level_names = ["Flat", "Wall Test", "Meat Boy", "Celeste", "N++", "Vertical Shaft"]
-            items = [{'name': n} for n in level_names]
-            # Handle mismatch if playground list size changed
-            total_levels = 6
-            if len(items) < total_levels:
-                items += [{'name': f"Level {i+1}"} for i in range(len(items), total_levels)]
-                
-            draw_selection_overlay(screen, "LEVEL", selection_index, items)
+            draw_selection_overlay(screen, "LEVEL", selection_index, level_items)
 
         pygame.display.flip()
         clock.tick(FPS)
@@ -7,6 +7,8 @@ import pygame
 import random
 import math
 
+from render_utils import to_display_alpha
+
 
 class Particle:
     """Lightweight particle with physics simulation."""
@@ -58,6 +60,7 @@ class ParticleSystem:
         self.pool_index = 0
         self.run_particle_timer = 0  # Throttle running particles
         self._surface_cache = {}  # Cache for pre-rendered particle surfaces
+        self._blit_list = []  # Scratch list for the batched blits() call
 
     def _get_next_particle(self):
         """Get next available particle from pool (ring buffer)."""
@@ -268,6 +271,8 @@ class ParticleSystem:
 
     def draw(self, surface):
         """Render all active particles with alpha fade (optimized with caching)."""
+        blit_list = self._blit_list
+        blit_list.clear()
         for particle in self.particles:
             if not particle.active:
                 continue
@@ -301,13 +306,15 @@ class ParticleSystem:
                     (size, size),
                     size
                 )
+                particle_surface = to_display_alpha(particle_surface)
                 self._surface_cache[cache_key] = particle_surface
 
-            # Blit cached surface
-            surface.blit(
+            # Queue cached surface; everything goes out in one blits() call
+            blit_list.append((
                 self._surface_cache[cache_key],
                 (int(particle.x - size), int(particle.y - size))
-            )
+            ))
+        surface.blits(blit_list, doreturn=0)
     def spawn_sword_arc(self, x, y, facing_right):
         """Link's Sword Arc"""
         start_angle = -math.pi/2 if facing_right else -math.pi/2
@@ -1,14 +1,26 @@
 import pygame
 from settings import *
 import random
-from sprites import Platform, Key
+from sprites import Platform, PlatformGroup, Key
 
 class PlaygroundManager:
     """Manages 4 different playground levels for testing"""
     
+    # (full title, short label for the level selection overlay), in load_playground() order
+    LEVELS = (
+        ("Level 1: Mario World", "Flat"),
+        ("Level 2: Wall Climb", "Wall Test"),
+        ("Level 3: SMB Factory", "Meat Boy"),
+        ("Level 4: Celeste Summit", "Celeste"),
+        ("Level 5: N++ Void", "N++"),
+        ("Level 6: The Shaft", "Vertical Shaft"),
+    )
+    NAMES = tuple(title for title, _ in LEVELS)
+    SHORT_NAMES = tuple(label for _, label in LEVELS)
+    
     def __init__(self):
         self.current_playground = 0
-        self.platforms = pygame.sprite.Group()
+        self.platforms = PlatformGroup()
         self.hazards = pygame.sprite.Group()
         self.keys = pygame.sprite.Group() # Replaces shadows
         self.start_pos = (200, SCREEN_HEIGHT - 200)
@@ -65,16 +77,8 @@ class PlaygroundManager:
     
     def get_name(self):
         """Get current playground name"""
-        names = [
-            "Level 1: Mario World", 
-            "Level 2: Wall Climb", 
-            "Level 3: SMB Factory",
-            "Level 4: Celeste Summit",
-            "Level 5: N++ Void",
-            "Level 6: The Shaft"
-        ]
-        if 0 <= self.current_playground < len(names):
-            return names[self.current_playground]
+        if 0 <= self.current_playground < len(self.NAMES):
+            return self.NAMES[self.current_playground]
         return "Unknown"
     
     
@@ -407,8 +411,7 @@ class PlaygroundManager:
     
     
     def draw(self, surface):
-        # Draw platforms individually to support high contrast outlines
-        for platform in self.platforms:
-            platform.draw(surface)
+        # PlatformGroup batches the blits and handles high contrast outlines
+        self.platforms.draw(surface)
         self.hazards.draw(surface)
         self.keys.draw(surface)
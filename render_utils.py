@@ -0,0 +1,12 @@
+"""
+Small rendering helpers shared by the gameplay and UI modules.
+"""
+
+import pygame
+
+
+def to_display_alpha(surf):
+    """convert_alpha() for cached surfaces, skipped before the display exists (it would raise)."""
+    if pygame.display.get_surface() is not None:
+        return surf.convert_alpha()
+    return surf
@@ -1,314 +1,254 @@
 import wave
-import math
-import struct
-import random
 import os
-
-def generate_tone(frequency, duration, volume=1.0, sample_rate=44100):
+from itertools import accumulate
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+
+# Longest built-in sound is the 0.6s laugh; scratch buffers grow if needed
+_MAX_DURATION = 0.6
+
+# Shared scratch buffers, reused by every _synth() call so regenerating the
+# whole sound set doesn't allocate fresh arrays per sound
+_scratch = {}
+_rng = np.random.default_rng()
+
+
+def _ensure_scratch(n_samples):
+    """Allocate (or grow) the shared float64/int16 work buffers."""
+    if _scratch and len(_scratch['idx']) >= n_samples:
+        return
+    size = max(n_samples, int(SAMPLE_RATE * _MAX_DURATION))
+    # float64 like the old per-sample math: in float32 the sine phase drifts enough
+    # to flip square-wave signs at zero crossings. Only the final PCM is cast
+    _scratch['idx'] = np.arange(size, dtype=np.float64)  # Sample indices, built once
+    for name in ('t', 'p', 'tone', 'noise', 'out'):
+        _scratch[name] = np.empty(size, dtype=np.float64)
+    _scratch['pcm'] = np.empty(size, dtype='<i2')  # 16-bit little-endian PCM
+
+
+# =============================================================================
+# ENVELOPES / FREQUENCY CURVES - functions of progress p (0..1) and time t (s)
+# =============================================================================
+
+def _attack_decay(peak):
+    """Linear 10% attack then linear decay to zero."""
+    return lambda p: np.where(p < 0.1, p / 0.1, 1.0 - (p - 0.1) / 0.9) * peak
+
+def _decay(power, peak=1.0):
+    """Polynomial decay from peak to zero."""
+    return lambda p: peak * (1.0 - p) ** power
+
+def _sweep(start, end):
+    """Linear frequency sweep from start to end Hz."""
+    return lambda p, t: start + (end - start) * p
+
+def _laugh_freq(p, t):
+    # Jittery frequency with a +100Hz wobble every 1000 samples
+    wobble = (np.rint(t * SAMPLE_RATE) // 1000 % 2 == 0) * 100.0
+    return 800 + np.sin(t * 50) * 200 + np.sin(t * 15) * 100 + wobble
+
+# Mario coin: B5 (987.77 Hz) to E6 (1318.51 Hz), switching at 15%
+_COIN_SWITCH = 0.15
+
+def _coin_freq(p, t):
+    return np.where(p < _COIN_SWITCH, 987.77, 1318.51)
+
+def _coin_env(p):
+    # Full volume for the first note, linear decay over the second
+    return np.where(p < _COIN_SWITCH, 1.0, 1.0 - (p - _COIN_SWITCH) / (1.0 - _COIN_SWITCH))
+
+
+# =============================================================================
+# SOUND DEFINITIONS
+#   dur:      duration in seconds
+#   freq_fn:  (p, t) -> Hz for the sine tone (omit for noise-only sounds)
+#   tone:     tone amplitude          square: True = square wave
+#   noise:    white noise amplitude   lowpass: one-pole filter coefficient
+#   env_fn:   p -> volume envelope    gain: overall multiplier
+#   clip:     clamp to [-1, 1] before quantizing
+# =============================================================================
+
+def jump_variant_config(pitch_factor=1.0, type="sine"):
+    base_freq = 300 * pitch_factor
+    return {
+        'dur': 0.2,
+        'freq_fn': _sweep(base_freq, base_freq * 2),  # Rising frequency
+        'square': type == "square",
+        'tone': 0.5 if type == "square" else 1.0,
+        'env_fn': _attack_decay(0.5 * 1.2),  # Boosted overall volume
+    }
+
+def dash_variant_config(pitch_factor=1.0):
+    return {
+        'dur': 0.2,
+        'freq_fn': _sweep(800 * pitch_factor, 200 * pitch_factor),
+        'tone': 0.5,
+        'noise': 0.5,
+        'env_fn': _decay(0.5, 0.6),
+    }
+
+SOUNDS = {
+    # Rising frequency from 300 to 600, attack/decay envelope
+    "jump.wav": {'dur': 0.2, 'freq_fn': _sweep(300, 600), 'env_fn': _attack_decay(0.5 * 0.8)},
+    # White noise, fast decay but louder start
+    "land.wav": {'dur': 0.15, 'noise': 1.0, 'env_fn': _decay(2)},
+    # Low-passed noise for a "rough" sound
+    "skid.wav": {'dur': 0.3, 'noise': 1.0, 'lowpass': 0.8, 'gain': 0.6},
+    # White noise mixed with a falling tone (air rush)
+    "dash.wav": dash_variant_config(1.0),
+    # Stronger low pass
+    "wall_slide.wav": {'dur': 0.5, 'noise': 1.0, 'lowpass': 0.9, 'gain': 0.3},
+    # Sharp metallic swish (Link)
+    "sword.wav": {'dur': 0.3, 'freq_fn': _sweep(1500, 500), 'tone': 0.7, 'noise': 0.3,
+                  'env_fn': _decay(2), 'gain': 1.2, 'clip': True},
+    # Sharp hiss (Ninja)
+    "shuriken.wav": {'dur': 0.15, 'noise': 1.0, 'env_fn': _decay(4, 0.8), 'gain': 1.5, 'clip': True},
+    # Mario coin sound (musical)
+    "coin.wav": {'dur': 0.4, 'freq_fn': _coin_freq, 'tone': 0.8, 'env_fn': _coin_env},
+    # Spooky/glitchy laugh (Madeline)
+    "laugh.wav": {'dur': 0.6, 'freq_fn': _laugh_freq, 'tone': 0.8, 'env_fn': _decay(1)},
+    # Meat squish - wet low-passed noise
+    "squish.wav": {'dur': 0.2, 'noise': 1.0, 'lowpass': 0.6, 'env_fn': _decay(2)},
+
+    # Character variants
+    # Mario: Classic slide whistle-ish (Sine)
+    "jump_Mario.wav": jump_variant_config(1.0, "sine"),
+    # Meat Boy: Squishier/Higher
+    "jump_Super Meat Boy.wav": jump_variant_config(1.5, "square"),
+    # Link: Normal
+    "jump_Link.wav": jump_variant_config(0.9, "sine"),
+    # Madeline: Soft
+    "jump_Madeline.wav": jump_variant_config(1.2, "sine"),
+    # Ninja: Sharp
+    "jump_Ninja (N++).wav": jump_variant_config(1.3, "sine"),
+}
+
+
+# =============================================================================
+# SYNTHESIS
+# =============================================================================
+
+def _one_pole_lowpass(buf, a):
+    """y[n] = a*y[n-1] + (1-a)*x[n], in place. Recursive, so not vectorizable."""
+    b = 1.0 - a
+    filtered = list(accumulate(buf.tolist(), lambda y, x: a * y + b * x, initial=0.0))
+    buf[:] = filtered[1:]
+
+def _synth(cfg):
+    """Render one sound config to 16-bit PCM bytes using the shared buffers."""
+    n = int(SAMPLE_RATE * cfg['dur'])
+    _ensure_scratch(n)
+
+    idx = _scratch['idx'][:n]
+    t = np.divide(idx, SAMPLE_RATE, out=_scratch['t'][:n])
+    p = np.divide(idx, n, out=_scratch['p'][:n])
+    out = _scratch['out'][:n]
+    out.fill(0.0)
+
+    freq_fn = cfg.get('freq_fn')
+    if freq_fn is not None:
+        # sin(2*pi*f*t) with f evaluated per sample, multiplied in the old loops' order
+        # so samples on a zero crossing keep the same sign
+        tone = _scratch['tone'][:n]
+        np.multiply(2.0 * np.pi, freq_fn(p, t), out=tone)
+        tone *= t
+        np.sin(tone, out=tone)
+        if cfg.get('square'):
+            np.sign(tone, out=tone)
+            tone[tone == 0.0] = -1.0  # Old loop: 1 if sin > 0 else -1
+        tone *= cfg.get('tone', 1.0)
+        out += tone
+
+    noise_amp = cfg.get('noise', 0.0)
+    if noise_amp:
+        noise = _scratch['noise'][:n]
+        _rng.random(out=noise)
+        noise *= 2.0
+        noise -= 1.0
+        if 'lowpass' in cfg:
+            _one_pole_lowpass(noise, cfg['lowpass'])
+        noise *= noise_amp
+        out += noise
+
+    env_fn = cfg.get('env_fn')
+    if env_fn is not None:
+        np.multiply(out, env_fn(p), out=out)
+    out *= cfg.get('gain', 1.0)
+    if cfg.get('clip'):
+        np.clip(out, -1.0, 1.0, out=out)
+
+    # Quantize into the reused int16 buffer (truncates toward zero like int())
+    out *= 32767.0
+    pcm = _scratch['pcm'][:n]
+    np.copyto(pcm, out, casting='unsafe')
+    return pcm.tobytes()
+
+
+def generate_tone(frequency, duration, volume=1.0, sample_rate=SAMPLE_RATE):
     n_samples = int(sample_rate * duration)
-    data = []
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        value = math.sin(2.0 * math.pi * frequency * t) * volume
-        data.append(int(value * 32767.0))
-    return data
+    t = np.arange(n_samples) / sample_rate
+    return (np.sin(2.0 * np.pi * frequency * t) * volume * 32767.0).astype(np.int16)
 
+def generate_sound(filename, cfg):
+    write_wav(filename, _synth(cfg), SAMPLE_RATE)
+
+# Per-sound entry points, each a thin wrapper over its SOUNDS config
 def generate_jump_sound(filename):
-    sample_rate = 44100
-    duration = 0.2
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        progress = i / n_samples
-        
-        # Rising frequency from 300 to 500
-        freq = 300 + (300 * progress)
-        
-        # Envelope: Attack and Decay
-        volume = 0.5
-        if progress < 0.1:
-            volume *= (progress / 0.1)
-        else:
-            volume *= (1.0 - (progress - 0.1) / 0.9)
-        
-        # Boost overall volume
-        volume *= 0.8
-            
-        value = math.sin(2.0 * math.pi * freq * t) * volume
-        data.append(int(value * 32767.0))
-    
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["jump.wav"])
 
 def generate_land_sound(filename):
-    sample_rate = 44100
-    duration = 0.15
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    for i in range(n_samples):
-        progress = i / n_samples
-        
-        # White noise
-        noise = (random.random() * 2.0 - 1.0)
-        
-        # Envelope: Fast decay but louder start
-        volume = 1.0 * (1.0 - progress)**2
-        
-        value = noise * volume
-        data.append(int(value * 32767.0))
-        
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["land.wav"])
 
 def generate_skid_sound(filename):
-    sample_rate = 44100
-    duration = 0.3
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    # Filter state
-    last_val = 0
-    
-    for i in range(n_samples):
-        # Noise
-        noise = (random.random() * 2.0 - 1.0)
-        
-        # Low pass filter for "rough" sound
-        value = last_val * 0.8 + noise * 0.2
-        last_val = value
-        
-        volume = 0.6
-        
-        data.append(int(value * 32767.0 * volume))
-        
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["skid.wav"])
 
 def generate_dash_sound(filename):
-    sample_rate = 44100
-    duration = 0.2
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        progress = i / n_samples
-        
-        # White noise mixed with tone
-        noise = (random.random() * 2.0 - 1.0) * 0.5
-        
-        # Frequency Sweep (Air rush)
-        freq = 800 - (600 * progress)
-        tone = math.sin(2.0 * math.pi * freq * t) * 0.5
-        
-        volume = 0.6 * (1.0 - progress)**0.5
-        
-        value = (noise + tone) * volume
-        data.append(int(value * 32767.0))
-        
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["dash.wav"])
 
 def generate_jump_variant(filename, pitch_factor=1.0, type="sine"):
-    sample_rate = 44100
-    duration = 0.2
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        progress = i / n_samples
-        
-        # Rising frequency
-        base_freq = 300 * pitch_factor
-        freq = base_freq + (base_freq * progress)
-        
-        volume = 0.5
-        if progress < 0.1: volume *= (progress / 0.1)
-        else: volume *= (1.0 - (progress - 0.1) / 0.9)
-        
-        # Boost overall volume
-        volume *= 1.2
-        
-        if type == "sine":
-            value = math.sin(2.0 * math.pi * freq * t) * volume
-        elif type == "square":
-            value = (1.0 if math.sin(2.0 * math.pi * freq * t) > 0 else -1.0) * volume * 0.5
-            
-        data.append(int(value * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, jump_variant_config(pitch_factor, type))
 
 def generate_dash_variant(filename, pitch_factor=1.0):
-    sample_rate = 44100
-    duration = 0.2
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        progress = i / n_samples
-        
-        noise = (random.random() * 2.0 - 1.0) * 0.5
-        freq = (800 * pitch_factor) - (600 * pitch_factor * progress)
-        tone = math.sin(2.0 * math.pi * freq * t) * 0.5
-        volume = 0.6 * (1.0 - progress)**0.5
-        
-        value = (noise + tone) * volume
-        data.append(int(value * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, dash_variant_config(pitch_factor))
 
 def generate_wall_slide_sound(filename):
-    sample_rate = 44100
-    duration = 0.5
-    n_samples = int(sample_rate * duration)
-    data = []
-    
-    last_val = 0
-    for i in range(n_samples):
-        noise = (random.random() * 2.0 - 1.0)
-        
-        # Stronger Low pass
-        value = last_val * 0.9 + noise * 0.1
-        last_val = value
-        
-        volume = 0.3
-        
-        data.append(int(value * 32767.0 * volume))
-        
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["wall_slide.wav"])
 
 def generate_sword_sound(filename):
-    # Sharp metallic swish (Link)
-    sample_rate = 44100
-    duration = 0.3
-    n_samples = int(sample_rate * duration)
-    data = []
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        progress = i / n_samples
-        noise = (random.random() * 2.0 - 1.0) * 0.3
-        freq = 1500 - (1000 * progress)
-        tone = math.sin(2.0 * math.pi * freq * t) * 0.7
-        volume = 1.0 * (1.0 - progress)**2
-        # Boost
-        value = (noise + tone) * volume * 1.2
-        # Clip
-        value = max(-1.0, min(1.0, value))
-        data.append(int(value * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["sword.wav"])
 
 def generate_shuriken_sound(filename):
-    # Sharp hiss (Ninja)
-    sample_rate = 44100
-    duration = 0.15
-    n_samples = int(sample_rate * duration)
-    data = []
-    for i in range(n_samples):
-        progress = i / n_samples
-        noise = (random.random() * 2.0 - 1.0)
-        volume = 0.8 * (1.0 - progress)**4
-        value = noise * volume * 1.5
-        value = max(-1.0, min(1.0, value))
-        data.append(int(value * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["shuriken.wav"])
 
 def generate_coin_sound(filename):
-    # Mario Coin sound (Musical)
-    sample_rate = 44100
-    duration = 0.4
-    n_samples = int(sample_rate * duration)
-    data = []
-    # B5 (987.77 Hz) to E6 (1318.51 Hz)
-    freq1 = 987.77
-    freq2 = 1318.51
-    switch_point = int(n_samples * 0.15)
-    
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        freq = freq1 if i < switch_point else freq2
-        value = math.sin(2.0 * math.pi * freq * t) * 0.8
-        # Decay
-        if i >= switch_point:
-             progress = (i - switch_point) / (n_samples - switch_point)
-             value *= (1.0 - progress)
-             
-        data.append(int(value * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["coin.wav"])
 
 def generate_laugh_sound(filename):
-    # Spooky/Glitchy laugh (Madeline)
-    sample_rate = 44100
-    duration = 0.6
-    n_samples = int(sample_rate * duration)
-    data = []
-    for i in range(n_samples):
-        t = float(i) / sample_rate
-        # Jittery frequency
-        freq = 800 + math.sin(t * 50) * 200 + math.sin(t * 15) * 100
-        if (i // 1000) % 2 == 0: freq += 100
-        
-        value = math.sin(2.0 * math.pi * freq * t) * 0.5
-        volume = 1.0 * (1.0 - (i/n_samples))
-        # Boost high freq
-        value = math.sin(2.0 * math.pi * freq * t) * 0.8
-        data.append(int(value * volume * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["laugh.wav"])
 
 def generate_squish_sound(filename):
-    # Meat squish
-    sample_rate = 44100
-    duration = 0.2
-    n_samples = int(sample_rate * duration)
-    data = []
-    last_val = 0
-    for i in range(n_samples):
-        noise = (random.random() * 2.0 - 1.0)
-        # Wet filter: alternate high pass / low pass? 
-        # Just simple low pass with resonance attempt
-        value = last_val * 0.6 + noise * 0.4
-        last_val = value
-        volume = 1.0 * (1.0 - i/n_samples)**2
-        data.append(int(value * volume * 32767.0))
-    write_wav(filename, data, sample_rate)
+    generate_sound(filename, SOUNDS["squish.wav"])
 
 
 def write_wav(filename, data, sample_rate):
+    """Write mono 16-bit PCM. data: raw little-endian bytes or an int sample sequence."""
+    if not isinstance(data, bytes):
+        data = np.asarray(data, dtype='<i2').tobytes()
     with wave.open(filename, 'w') as f:
         f.setnchannels(1) # Mono
         f.setsampwidth(2) # 2 bytes per sample (16-bit)
         f.setframerate(sample_rate)
-        
-        # Pack data
-        packed_data = struct.pack('<' + ('h' * len(data)), *data)
-        f.writeframes(packed_data)
+        f.writeframes(data)
     print(f"Generated {filename}")
 
 def generate_all_sounds(output_dir="sounds"):
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
-        
-    generate_jump_sound(os.path.join(output_dir, "jump.wav"))
-    generate_land_sound(os.path.join(output_dir, "land.wav"))
-    generate_skid_sound(os.path.join(output_dir, "skid.wav"))
-    generate_dash_sound(os.path.join(output_dir, "dash.wav"))
-    generate_wall_slide_sound(os.path.join(output_dir, "wall_slide.wav"))
-    
-    generate_sword_sound(os.path.join(output_dir, "sword.wav"))
-    generate_shuriken_sound(os.path.join(output_dir, "shuriken.wav"))
-    generate_coin_sound(os.path.join(output_dir, "coin.wav"))
-    generate_laugh_sound(os.path.join(output_dir, "laugh.wav"))
-    generate_squish_sound(os.path.join(output_dir, "squish.wav"))
-    
-    # Character Variants
-    # Mario: Classic slide whistle-ish (Sine)
-    generate_jump_variant(os.path.join(output_dir, "jump_Mario.wav"), 1.0, "sine")
-    # Meat Boy: Squishier/Higher
-    generate_jump_variant(os.path.join(output_dir, "jump_Super Meat Boy.wav"), 1.5, "square")
-    # Link: Normal
-    generate_jump_variant(os.path.join(output_dir, "jump_Link.wav"), 0.9, "sine")
-    # Madeline: Soft
-    generate_jump_variant(os.path.join(output_dir, "jump_Madeline.wav"), 1.2, "sine")
-    # Ninja: Sharp
-    generate_jump_variant(os.path.join(output_dir, "jump_Ninja (N++).wav"), 1.3, "sine")
-    
+
+    for filename, cfg in SOUNDS.items():
+        generate_sound(os.path.join(output_dir, filename), cfg)
+
 if __name__ == "__main__":
     generate_all_sounds()
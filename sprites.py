@@ -3,11 +3,18 @@ Reusable sprite classes for the game.
 """
 
 import pygame
+from accessibility import accessibility, get_platform_outline_settings
+from render_utils import to_display_alpha
 
 
 class Platform(pygame.sprite.Sprite):
     """A solid platform that players can stand on."""
     
+    __slots__ = ('base_image', 'image', 'rect', 'is_finish', 'block_type', 'color',
+                 'width', 'height', 'base_y', 'jiggle_timer', 'jiggle_offset',
+                 'is_hit', 'is_broken', 'adjusted_image', '_accessibility_version',
+                 '_inner_rect', '_inner_rect_dirty')
+    
     def __init__(self, x, y, width, height, color=(100, 100, 100), is_finish=False, block_type=None):
         super().__init__()
         self.base_image = pygame.Surface((width, height))
@@ -26,12 +33,23 @@ class Platform(pygame.sprite.Sprite):
         self.jiggle_offset = 0
         self.is_hit = False
         self.is_broken = False
+        
+        # Colorblind-adjusted copy of image, rebuilt only when the mode changes
+        self.adjusted_image = None
+        self._accessibility_version = -1
+        
+        # High Contrast inner outline rect, recomputed only after rect moves
+        self._inner_rect = None
+        self._inner_rect_dirty = True
     
     def hit_from_below(self):
         """Called when player headbutts this block from below."""
         if self.block_type == 'question' and not self.is_hit:
             self.is_hit = True
             self.jiggle_timer = 15  # 15 frames of jiggle
+            for group in self.groups():
+                if isinstance(group, PlatformGroup):
+                    group.start_animating(self)
             return 'jiggle'
         elif self.block_type == 'brick':
             self.is_broken = True
@@ -50,51 +68,108 @@ class Platform(pygame.sprite.Sprite):
             else:
                 self.jiggle_offset = 0
             self.rect.y = self.base_y + self.jiggle_offset
+            self._inner_rect_dirty = True
             
             # Dim the question block when hit (used)
             if self.jiggle_timer == 0 and self.block_type == 'question':
-                self.base_image.fill((100, 80, 40))  # Darker "used" color
-                self.image = self.base_image.copy()
+                self.color = (100, 80, 40)  # Darker "used" color
+                self.base_image.fill(self.color)
+                self.image.fill(self.color)  # In place, no new Surface
+                self._accessibility_version = -1  # Rebuild adjusted_image from the new color
+    
+    def get_adjusted_image(self):
+        """Return the colorblind-adjusted image, rebuilding it only after a mode change."""
+        if self._accessibility_version != accessibility.version:
+            self.adjusted_image = self.base_image.copy()
+            self.adjusted_image.fill(accessibility.adjust_color(self.color))
+            self._accessibility_version = accessibility.version
+        return self.adjusted_image
+    
+    def draw_outline(self, surface, color, thickness, inner_color, inner_thickness):
+        """Draw the High Contrast outline (values come from get_platform_outline_settings)."""
+        draw_rect = pygame.draw.rect
+        rect = self.rect
+        # Draw bold outer outline
+        draw_rect(surface, color, rect, thickness)
+        # Draw inner highlight line for extra contrast
+        if self._inner_rect_dirty:
+            self._inner_rect = rect.inflate(-thickness * 2, -thickness * 2)
+            self._inner_rect_dirty = False
+        inner_rect = self._inner_rect
+        if inner_rect.width > 0 and inner_rect.height > 0:
+            draw_rect(surface, inner_color, inner_rect, inner_thickness)
+
+
+class PlatformGroup(pygame.sprite.Group):
+    """Sprite group that draws every platform with one batched blits() call."""
+    
+    def __init__(self, *sprites):
+        self._blit_list = []  # Reused every frame, cleared instead of reallocated
+        self._animating = set()  # Platforms mid-jiggle; the only ones update() visits
+        super().__init__(*sprites)
+    
+    def start_animating(self, platform):
+        """Register a platform whose update() has work to do."""
+        self._animating.add(platform)
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._animating.discard(sprite)
+    
+    def update(self, *args, **kwargs):
+        """Update only animating platforms; static ones would be no-op calls."""
+        for platform in tuple(self._animating):
+            platform.update(*args, **kwargs)
+            if platform.jiggle_timer == 0:
+                self._animating.discard(platform)
     
     def draw(self, surface):
-        """Draw platform with colorblind adjustments and high contrast outlines."""
-        from accessibility import get_platform_outline_settings, accessibility
+        """Blit all platforms in one call, then draw outlines in a second pass if enabled."""
+        # Accessibility state and outline settings are read once per frame, not per platform
+        active = accessibility.is_active
+        settings = get_platform_outline_settings()
         
-        # Apply colorblind color adjustment if any mode is active
-        if accessibility.is_active:
-            adjusted_color = accessibility.adjust_color(self.color)
-            # Create adjusted image
-            adjusted_image = pygame.Surface((self.width, self.height))
-            adjusted_image.fill(adjusted_color)
-            surface.blit(adjusted_image, self.rect)
+        platforms = self.sprites()
+        blit_list = self._blit_list
+        blit_list.clear()
+        append = blit_list.append
+        if active:
+            for platform in platforms:
+                append((platform.get_adjusted_image(), platform.rect))
         else:
-            # Draw the platform normally
-            surface.blit(self.image, self.rect)
+            for platform in platforms:
+                append((platform.image, platform.rect))
+        surface.blits(blit_list, doreturn=0)
         
-        # Add outline in High Contrast mode using centralized settings
-        settings = get_platform_outline_settings()
         if settings['enabled']:
-            # Draw bold outer outline
-            pygame.draw.rect(surface, settings['color'], self.rect, settings['thickness'])
-            # Draw inner highlight line for extra contrast
-            inner_rect = self.rect.inflate(-settings['thickness'] * 2, -settings['thickness'] * 2)
-            if inner_rect.width > 0 and inner_rect.height > 0:
-                pygame.draw.rect(surface, settings['inner_color'], inner_rect, settings['inner_thickness'])
-
+            color, thickness = settings['color'], settings['thickness']
+            inner_color, inner_thickness = settings['inner_color'], settings['inner_thickness']
+            for platform in platforms:
+                platform.draw_outline(surface, color, thickness, inner_color, inner_thickness)
 
 
 class Key(pygame.sprite.Sprite):
     """Victory key that appears at the end of levels."""
     
+    __slots__ = ('image', 'rect', 'color')
+    
+    # Baked key images shared by every instance: {color: Surface}
+    _image_cache = {}
+    
     def __init__(self, x, y, color):
         super().__init__()
-        self.image = pygame.Surface((20, 20), pygame.SRCALPHA)
-        # Draw key shape (circle + rect)
-        pygame.draw.circle(self.image, color, (10, 6), 6)
-        pygame.draw.rect(self.image, color, (8, 10, 4, 10))
-        # Teeth
-        pygame.draw.rect(self.image, color, (12, 14, 4, 3))
-        pygame.draw.rect(self.image, color, (12, 17, 4, 3))
+        cache_key = tuple(color)
+        if cache_key not in Key._image_cache:
+            image = pygame.Surface((20, 20), pygame.SRCALPHA)
+            # Draw key shape (circle + rect)
+            pygame.draw.circle(image, color, (10, 6), 6)
+            pygame.draw.rect(image, color, (8, 10, 4, 10))
+            # Teeth
+            pygame.draw.rect(image, color, (12, 14, 4, 3))
+            pygame.draw.rect(image, color, (12, 17, 4, 3))
+            image = to_display_alpha(image)
+            Key._image_cache[cache_key] = image
+        self.image = Key._image_cache[cache_key]
         
         self.rect = self.image.get_rect(center=(x, y))
         self.color = color
@@ -103,20 +178,26 @@ class Key(pygame.sprite.Sprite):
 class Hazard(pygame.sprite.Sprite):
     """A hazard that damages or kills the player on contact."""
     
+    __slots__ = ('image', 'rect')
+    
+    # Baked spike images shared by every instance: {(color, width, height): Surface}
+    _image_cache = {}
+    
     def __init__(self, x, y, width, height, color=(255, 0, 0)):
         super().__init__()
-        self.image = pygame.Surface((width, height), pygame.SRCALPHA)
-        # Draw spikes/hazard pattern
-        spike_count = max(1, width // 10)
-        spike_width = width / spike_count
-        for i in range(spike_count):
-            pygame.draw.polygon(
-                self.image, 
-                color,
-                [
-                    (i * spike_width, height),
-                    (i * spike_width + spike_width / 2, 0),
-                    ((i + 1) * spike_width, height)
-                ]
-            )
+        cache_key = (tuple(color), width, height)
+        if cache_key not in Hazard._image_cache:
+            image = pygame.Surface((width, height), pygame.SRCALPHA)
+            # Draw spikes/hazard pattern as one zigzag polygon: base-left, then
+            # (tip, base) per spike, closing back along the bottom edge
+            spike_count = max(1, width // 10)
+            spike_width = width / spike_count
+            points = [(0, height)]
+            for i in range(spike_count):
+                points.append((i * spike_width + spike_width / 2, 0))
+                points.append(((i + 1) * spike_width, height))
+            pygame.draw.polygon(image, color, points)
+            image = to_display_alpha(image)
+            Hazard._image_cache[cache_key] = image
+        self.image = Hazard._image_cache[cache_key]
         self.rect = self.image.get_rect(topleft=(x, y))
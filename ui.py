@@ -1,27 +1,30 @@
+import operator
+from collections import OrderedDict
+
 import pygame
+import numpy as np
 from settings import SCREEN_HEIGHT, SCREEN_WIDTH
-from character_profiles import MARIO, SUPER_MEAT_BOY, ZELDA_LINK, MADELINE, N_NINJA
+from character_profiles import CHARACTERS
 from character_faces import get_face_data
-
-# Cached fonts for PS5 button icons (avoid creating every frame)
-_ps5_button_fonts = {}
-
-def _get_ps5_font(size, bold=False):
-    """Get cached font for PS5 button text."""
-    key = (size, bold)
-    if key not in _ps5_button_fonts:
-        _ps5_button_fonts[key] = pygame.font.SysFont(None, size, bold=bold)
-    return _ps5_button_fonts[key]
-
+from ui_theme import (get_font, font_header, font_large, font_text, font_small, get_colors, theme,
+                      get_widget_background, TOP_ROW_Y, MARGIN_LEFT, MARGIN_RIGHT,
+                      LEFT_PANEL_X, LEFT_PANEL_Y, LEFT_PANEL_WIDTH, LEFT_PANEL_HEIGHT,
+                      RIGHT_PANEL_Y, SLIDER_WIDTH, SPACING_LINE, SPACING_ITEM, SPACING_SECTION)
+from render_utils import to_display_alpha
+from accessibility import accessibility
+import llm_physics
 
 # Cache for pre-rendered PS5 button icons
 _ps5_button_cache = {}
 
+# Supersampling factor for PS5 icons; 2x is plenty for these simple shapes
+_PS5_SUPERSAMPLE = 2
+
 def _create_ps5_button_surface(button_type, size):
     """Create a high-quality PS5 button icon using supersampling."""
-    # Supersample at 4x for anti-aliasing
-    scale = 4
+    scale = _PS5_SUPERSAMPLE
     big_size = size * scale
+    final_size = (size, size)  # Shoulder buttons override this with their own width
     
     # Create surface with alpha
     big_surface = pygame.Surface((big_size, big_size), pygame.SRCALPHA)
@@ -74,22 +77,25 @@ def _create_ps5_button_surface(button_type, size):
         pygame.draw.polygon(big_surface, symbol_color, points, thickness)
     
     elif button_type in ('l1', 'r1', 'l2', 'r2'):
-        # Shoulder/trigger buttons - sized to match target height
-        # Work at 4x scale for anti-aliasing, then scale down
-        scale = 4
-        target_height = size * scale
+        # Shoulder/trigger buttons - sized to match target height. Proportions come
+        # from the 4x layout (measured, not rendered); the text itself is already
+        # antialiased, so it's rendered straight at the final size
+        label = button_type.upper()
+        ref_height = size * 4
         
         # Font fills 85% of height (minimal padding)
-        font_size = int(target_height * 0.85)
-        font = pygame.font.SysFont(None, font_size, bold=True)
-        txt = font.render(button_type.upper(), True, symbol_color)
+        ref_font_size = int(ref_height * 0.85)
+        ref_width, ref_text_height = get_font(ref_font_size, bold=True).size(label)
         
         # Minimal padding
-        padding_x = int(target_height * 0.12)
-        padding_y = int(target_height * 0.05)
+        padding_x = int(ref_height * 0.12)
+        padding_y = int(ref_height * 0.05)
         
-        rect_width = txt.get_width() + padding_x * 2
-        rect_height = txt.get_height() + padding_y * 2
+        # Shrink the 4x layout so the button is exactly `size` tall
+        ratio = size / (ref_text_height + padding_y * 2)
+        rect_width = int((ref_width + padding_x * 2) * ratio)
+        rect_height = size
+        txt = get_font(max(1, round(ref_font_size * ratio)), bold=True).render(label, True, symbol_color)
         
         # Create surface
         big_surface = pygame.Surface((rect_width, rect_height), pygame.SRCALPHA)
@@ -98,94 +104,242 @@ def _create_ps5_button_surface(button_type, size):
         pygame.draw.rect(big_surface, circle_color, (0, 0, rect_width, rect_height), border_radius=rect_height // 4)
         
         # Draw text
-        big_surface.blit(txt, (padding_x, padding_y))
-        
-        # Scale down to target size
-        final_height = size
-        final_width = int(rect_width * size / rect_height)
-        small_surface = pygame.transform.smoothscale(big_surface, (final_width, final_height))
-        return small_surface
+        big_surface.blit(txt, txt.get_rect(center=(rect_width // 2, rect_height // 2)))
+        final_size = (rect_width, rect_height)  # Already final, so no resample below
     
-    # Scale down with smooth anti-aliasing
-    small_surface = pygame.transform.smoothscale(big_surface, (size, size))
-    return small_surface
+    # Scale down with smooth anti-aliasing. For an integer factor smoothscale is an exact
+    # box filter; plain scale() would just pick one subsample and undo the anti-aliasing
+    if big_surface.get_size() == final_size:
+        small_surface = big_surface  # Supersampling disabled, nothing to resample
+    else:
+        small_surface = pygame.transform.smoothscale(big_surface, final_size)
+    return to_display_alpha(small_surface)  # Cached and blitted every frame
 
-def draw_ps5_button(surface, x, y, button_type, size=20):
+# Abilities listed in the left panel, in display order: (profile flag, label)
+_ABILITIES = (
+    ('variable_jump', "Variable Jump"),
+    ('has_momentum', "Momentum"),
+    ('has_wall_jump', "Wall Jump"),
+    ('has_double_jump', "Double Jump"),
+    ('has_dash', "Dash"),
+)
+_ability_flags = operator.attrgetter(*(flag for flag, _ in _ABILITIES))  # profile -> tuple of bools
+
+# Label tuples per flag combination, shared by every profile: {flags: labels}
+_ability_labels_cache = {}
+
+def _ability_labels(profile):
+    """Labels of the abilities the profile has, in display order."""
+    # Keyed on the live flags rather than cached on the profile, since
+    # LLM customization can set any field at runtime
+    flags = _ability_flags(profile)
+    labels = _ability_labels_cache.get(flags)
+    if labels is None:
+        labels = tuple(label for (_, label), has_it in zip(_ABILITIES, flags) if has_it)
+        _ability_labels_cache[flags] = labels
+    return labels
+
+# Left panel CONTROLS rows: (label, PS5 button drawn beside it or None)
+_CONTROL_ROWS = (("Move: Stick / D-Pad", None), ("Jump:", 'x'), ("Run/Dash:", 'square'))
+
+# Cache for rendered label surfaces: {(font, text, color): Surface}, least recently used first
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_MAX = 512  # Room for every static label plus churn from typed/status text
+
+def _render_cached(font, text, color):
+    """Render antialiased text once and reuse the surface on later frames."""
+    key = (font, text, color)
+    surf = _TEXT_CACHE.get(key)
+    if surf is None:
+        surf = to_display_alpha(font.render(text, True, color))
+        if len(_TEXT_CACHE) >= _TEXT_CACHE_MAX:
+            _TEXT_CACHE.popitem(last=False)
+        _TEXT_CACHE[key] = surf
+    else:
+        _TEXT_CACHE.move_to_end(key)  # Labels drawn every frame never age out
+    return surf
+
+# Baked 32x32 character faces: {(profile name, color): Surface}
+_face_surface_cache = {}
+
+# Face grids reduced to (distinct chars, 8x8 palette indices in row order): {rows: ...}
+_face_index_cache = {}
+
+def _face_index_grid(pixels):
+    """Parse a face's character grid into palette indices once; only colors vary after that."""
+    key = tuple(pixels)
+    entry = _face_index_cache.get(key)
+    if entry is None:
+        # Clip/pad to 8x8 with '.', which color maps leave transparent
+        rows = [list(line[:8].ljust(8, '.')) for line in pixels[:8]]
+        rows += [['.'] * 8] * (8 - len(rows))
+        chars, idx = np.unique(np.array(rows), return_inverse=True)
+        entry = (chars.tolist(), idx.reshape(8, 8))
+        _face_index_cache[key] = entry
+    return entry
+
+def _build_face_surface(pixels, color_map, default_color, scale=4):
+    """Map the face's character grid through a palette in one NumPy gather, upscaled in NumPy."""
+    chars, idx = _face_index_grid(pixels)
+    
+    palette = np.zeros((len(chars), 4), dtype=np.uint8)  # RGBA, alpha 0 = transparent
+    for i, char in enumerate(chars):
+        color = color_map.get(char, default_color)
+        if color:
+            palette[i] = (*tuple(color)[:3], 255)
+    # Gather, then repeat each cell scale x scale: the full-size image in one pass
+    rgba = palette[idx].repeat(scale, axis=0).repeat(scale, axis=1)
+    
+    # Row-major RGBA bytes go straight into a surface in one copy
+    face = pygame.image.frombytes(rgba.tobytes(), (8 * scale, 8 * scale), "RGBA")
+    return to_display_alpha(face)
+
+def _get_face_surface(profile):
+    """The profile's baked 32x32 face, built on first use per (name, color)."""
+    key = (profile.name, tuple(profile.color))
+    face = _face_surface_cache.get(key)
+    if face is None:
+        pixels, color_map = get_face_data(profile.name, profile.color)
+        face = _build_face_surface(pixels, color_map, profile.color)
+        _face_surface_cache[key] = face
+    return face
+
+# Word-wrapped description lines, shared so kept immutable: {(id(font), text, max_width): (line, ...)}
+_wrap_cache = {}
+
+def _wrap_pixels(font, text, max_width):
+    """Greedy word wrap by rendered width in pixels, measuring each word once."""
+    space_width = font.size(" ")[0]
+    lines = []
+    current_words = []
+    current_width = 0
+    for word in text.split():
+        word_width = font.size(word)[0]
+        if current_words and current_width + space_width + word_width > max_width:
+            lines.append(" ".join(current_words))
+            current_words = [word]
+            current_width = word_width
+        else:
+            current_width += space_width + word_width if current_words else word_width
+            current_words.append(word)
+    if current_words:
+        lines.append(" ".join(current_words))
+    return lines
+
+def _wrap_description(font, text, max_width):
+    """_wrap_pixels(), computed once per (font, text, width)."""
+    key = (id(font), text, max_width)
+    lines = _wrap_cache.get(key)
+    if lines is None:
+        lines = tuple(_wrap_pixels(font, text, max_width))
+        _wrap_cache[key] = lines
+    return lines
+
+def _ps5_button_blit(x, y, button_type, size=20):
     """
-    Draw a PS5-style button icon at the given position.
-    button_type: 'x', 'square', 'circle', 'triangle', 'l1', 'r1', 'l2', 'r2', 'options'
-    Returns the width of the drawn element for text positioning.
+    Return ((surface, pos), width) for a PS5-style button icon, so callers can
+    batch it into a blits() call. Same types and widths as draw_ps5_button.
     """
-    if button_type in ('x', 'square', 'circle', 'triangle'):
+    if button_type in ('x', 'square', 'circle', 'triangle', 'l1', 'r1', 'l2', 'r2'):
         # Use cached high-quality icon
         cache_key = (button_type, size)
         if cache_key not in _ps5_button_cache:
             _ps5_button_cache[cache_key] = _create_ps5_button_surface(button_type, size)
         
         icon = _ps5_button_cache[cache_key]
-        surface.blit(icon, (x, y))
-        return size + 4
-        
-    elif button_type in ('l1', 'r1', 'l2', 'r2'):
-        # Use cached high-quality shoulder/trigger icon
-        cache_key = (button_type, size)
-        if cache_key not in _ps5_button_cache:
-            _ps5_button_cache[cache_key] = _create_ps5_button_surface(button_type, size)
-        
-        icon = _ps5_button_cache[cache_key]
-        surface.blit(icon, (x, y))
-        return icon.get_width() + 4
+        if button_type in ('x', 'square', 'circle', 'triangle'):
+            return (icon, (x, y)), size + 4
+        # Shoulder/trigger icons are wider than tall
+        return (icon, (x, y)), icon.get_width() + 4
         
     elif button_type == 'options':
-        font = _get_ps5_font(14)
-        txt = font.render("OPTIONS", True, (80, 82, 90))
-        surface.blit(txt, (x, y + 2))
-        return txt.get_width() + 4
+        txt = _render_cached(get_font(14), "OPTIONS", (80, 82, 90))
+        return (txt, (x, y + 2)), txt.get_width() + 4
         
-    return 0
+    return None, 0
+
+def draw_ps5_button(surface, x, y, button_type, size=20):
+    """
+    Draw a PS5-style button icon at the given position.
+    button_type: 'x', 'square', 'circle', 'triangle', 'l1', 'r1', 'l2', 'r2', 'options'
+    Returns the width of the drawn element for text positioning.
+    """
+    item, width = _ps5_button_blit(x, y, button_type, size)
+    if item is not None:
+        surface.blit(*item)
+    return width
+
+def _value_to_x(val, min_val, max_val, track_x, track_width):
+    """Map a slider value onto its track's pixel x (no clamping)."""
+    return track_x + (val - min_val) / (max_val - min_val) * track_width
+
+def _x_to_value(px_x, min_val, max_val, track_x, track_width):
+    """Inverse of _value_to_x."""
+    return min_val + (px_x - track_x) / track_width * (max_val - min_val)
+
+def _field_setter(name):
+    """Build a (profile, value) setter that writes a plain dataclass field directly."""
+    def set_field(profile, val):
+        profile.__dict__[name] = val
+    return set_field
 
 class Slider:
-    def __init__(self, x, y, width, height, min_val, max_val, initial_val, label, param_name):
+    __slots__ = ('rect', 'min_val', 'max_val', 'param_name', 'setter', 'getter', 'label',
+                 'is_int', '_label_prefix', 'dragging', 'default_val',
+                 '_current_value', 'default_x', 'handle_width', '_handle_half', 'handle_rect', 'font',
+                 '_label_cache_key', '_label_surf', '_label_raw_key', '_track_surfs')
+    
+    def __init__(self, x, y, width, height, min_val, max_val, initial_val, label, param_name,
+                 setter=None, is_int=False):
         self.rect = pygame.Rect(x, y, width, height)
         self.min_val = min_val
         self.max_val = max_val
         self.param_name = param_name
+        # Called as setter(profile, value) on every drag/step update
+        self.setter = setter if setter is not None else _field_setter(param_name)
+        self.getter = operator.attrgetter(param_name)  # profile -> current value
         self.label = label
+        # Integer sliders always show whole numbers; the rest show 2 decimals unless
+        # the value is whole (e.g. "Jump: 14")
+        self.is_int = is_int
+        self._label_prefix = f"{label}: "  # Fixed per slider, so only the number is formatted
         self.dragging = False
         self.default_val = initial_val  # Store default for tick mark
+        self._current_value = initial_val  # Last dragged value, for profile-less sliders
+        # Pixel X of the default tick; value and track never move, so computed once
+        self.default_x = _value_to_x(initial_val, min_val, max_val, x, width)
         
         self.handle_width = 8
+        self._handle_half = self.handle_width / 2
         self.handle_rect = pygame.Rect(x, y - 2, self.handle_width, height + 4)
         self.update_handle_pos(initial_val)
         
-        self.font = pygame.font.SysFont(None, 20)  # Larger font
+        self.font = get_font(20)  # Larger font, shared by all sliders
+        
+        # Rendered label, re-rendered only when its text or color changes
+        self._label_cache_key = None
+        self._label_surf = None
+        self._label_raw_key = None  # (raw value, highlighted) of the last call
+        
+        # Prerendered track + default tick: {highlighted: Surface}
+        self._track_surfs = {}
 
     def update_handle_pos(self, val):
         val = max(self.min_val, min(val, self.max_val))
-        range_val = self.max_val - self.min_val
-        pct = (val - self.min_val) / range_val
-        px_x = self.rect.x + (pct * self.rect.width) - (self.handle_width / 2)
-        self.handle_rect.x = px_x
-
-    def get_default_x(self):
-        """Get pixel X position for default value tick mark."""
-        range_val = self.max_val - self.min_val
-        pct = (self.default_val - self.min_val) / range_val
-        return self.rect.x + (pct * self.rect.width)
+        self.handle_rect.x = _value_to_x(val, self.min_val, self.max_val,
+                                         self.rect.x, self.rect.width) - self._handle_half
 
     def get_value_from_pos(self, mouse_x):
         mouse_x = max(self.rect.left, min(mouse_x, self.rect.right))
-        pct = (mouse_x - self.rect.left) / self.rect.width
-        val = self.min_val + (pct * (self.max_val - self.min_val))
-        return val
+        return _x_to_value(mouse_x, self.min_val, self.max_val, self.rect.left, self.rect.width)
     
     def adjust_by_step(self, direction, profile):
         """Adjust value by a step. direction: -1 or +1"""
-        current = getattr(profile, self.param_name)
+        current = self.getter(profile)
         step = (self.max_val - self.min_val) / 20  # 5% steps
         new_val = current + (direction * step)
         new_val = max(self.min_val, min(new_val, self.max_val))
-        setattr(profile, self.param_name, new_val)
+        self.setter(profile, new_val)
         self.update_handle_pos(new_val)
 
     def handle_event(self, event, profile):
@@ -206,52 +360,109 @@ class Slider:
         self.update_handle_pos(val)
         self._current_value = val  # Store internally
         if profile is not None:
-            setattr(profile, self.param_name, val)
+            self.setter(profile, val)
     
     def get_value(self):
         """Get current slider value."""
-        return getattr(self, '_current_value', self.default_val)
+        return self._current_value
 
-    def draw(self, surface, profile, highlighted=False):
+    # Label color indexed by highlighted: dark gray for light theme readability, then yellow
+    LABEL_COLORS = ((60, 60, 70), (255, 255, 100))
+    
+    def get_label_surface(self, profile, highlighted=False):
+        """Return the rendered "Label: value" surface, re-rendering only on change."""
         if profile is not None:
-            current_val = getattr(profile, self.param_name)
+            current_val = self.getter(profile)
         else:
             current_val = self.get_value()
         
-        # Label with better contrast
-        if highlighted:
-            label_color = (255, 255, 100)  # Yellow when selected
-        else:
-            label_color = (60, 60, 70)  # Dark gray for light theme readability
-        
-        # Format differently for integer vs float values
-        if current_val == int(current_val):
-            label_surf = self.font.render(f"{self.label}: {int(current_val)}", True, label_color)
-        else:
-            label_surf = self.font.render(f"{self.label}: {current_val:.2f}", True, label_color)
-        surface.blit(label_surf, (self.rect.x, self.rect.y - 18))
-        
-        # Track background
-        track_color = (100, 100, 60) if highlighted else (140, 145, 160)
-        pygame.draw.rect(surface, track_color, self.rect)
-        
-        # Default tick mark - ALWAYS GREEN per user request
-        default_x = self.get_default_x()
-        tick_color = (50, 180, 80)  # Green for default position
-        pygame.draw.line(surface, tick_color, 
-                        (default_x, self.rect.y - 4), 
-                        (default_x, self.rect.y + self.rect.height + 4), 3)
-        
-        # Handle
-        if highlighted:
-            handle_color = (255, 220, 0)
-        elif self.dragging:
-            handle_color = (255, 220, 0)
-        else:
-            handle_color = (160, 160, 160)
-        pygame.draw.rect(surface, handle_color, self.handle_rect)
+        # Idle frames: same raw value and highlight as last time, nothing to do
+        raw_key = (current_val, highlighted)
+        if raw_key == self._label_raw_key:
+            return self._label_surf
+        self._label_raw_key = raw_key
+        
+        label_color = self.LABEL_COLORS[bool(highlighted)]
+        
+        # Snap to the displayed precision so drag jitter below it reuses the
+        # same surface, and skip formatting entirely on a cache hit
+        whole = self.is_int or current_val == int(current_val)
+        display_val = round(current_val) if whole else round(current_val, 2)
+        # whole is part of the key since 14 and 14.0 compare equal but read "14" and "14.00"
+        key = (display_val, whole, label_color)
+        if key != self._label_cache_key:
+            text = self._label_prefix + (str(display_val) if whole else format(display_val, '.2f'))
+            self._label_surf = _render_cached(self.font, text, label_color)
+            self._label_cache_key = key
+        return self._label_surf
+    
+    def get_label_pos(self):
+        return (self.rect.x, self.rect.y - 18)
+    
+    # Track color indexed by highlighted: blue-grey, then olive; the default tick is always green
+    TRACK_COLORS = ((140, 145, 160), (100, 100, 60))
+    TICK_COLOR = (50, 180, 80)
+    
+    def get_track_surface(self, highlighted=False):
+        """Return the track background and default-value tick, prerendered per highlight state."""
+        surf = self._track_surfs.get(highlighted)
+        if surf is None:
+            rect = self.rect
+            # Tick overhangs the track by 4px vertically and 1px either side of default_x
+            ox, oy = self.get_track_pos()
+            surf = pygame.Surface((rect.width + 8, rect.height + 10), pygame.SRCALPHA)
+            
+            # Track background
+            pygame.draw.rect(surf, self.TRACK_COLORS[bool(highlighted)], rect.move(-ox, -oy))
+            
+            # Default tick mark - ALWAYS GREEN per user request
+            default_x = self.default_x - ox
+            pygame.draw.line(surf, self.TICK_COLOR, 
+                            (default_x, rect.y - 4 - oy), 
+                            (default_x, rect.y + rect.height + 4 - oy), 3)
+            
+            surf = to_display_alpha(surf)
+            self._track_surfs[highlighted] = surf
+        return surf
+    
+    def get_track_pos(self):
+        """Top-left of the track surface on screen."""
+        return (self.rect.x - 4, self.rect.y - 5)
+    
+    # Handle color indexed by (highlighted or dragging): grey, then yellow
+    HANDLE_COLORS = ((160, 160, 160), (255, 220, 0))
+    
+    def draw_handle(self, surface, highlighted=False, origin=(0, 0)):
+        """Draw the handle; origin is the screen position of surface's top-left corner."""
+        pygame.draw.rect(surface, self.HANDLE_COLORS[bool(highlighted or self.dragging)],
+                         self.handle_rect.move(-origin[0], -origin[1]))
 
 class ControlPanel:
+    __slots__ = ('player', 'sound_manager', 'sliders', 'rebind_mode', 'selected_slider',
+                 'physics_adjust_mode', 'volume', 'visuals_adjust_mode', 'visuals_selected',
+                 'sound_volume', 'reset_toggle_state', 'text_input_active',
+                 '_customize_buf', '_customize_text', '_customize_dirty', 'cursor_blink_timer',
+                 'llm_processing', 'llm_status', '_typed_wrap', '_typed_surfs', 'accessibility',
+                 '_font_header', '_font_text', '_font_small', '_font_large', 'visible',
+                 '_left_cache', '_left_cache_key', '_line_positions',
+                 '_top_row_cache', '_right_panel_cache', '_slider_cache', '_customize_cache',
+                 'volume_slider_index', 'customize_index', 'reset_index', 'total_settings_count',
+                 '_dragging', '_slider_hit_rects', '_sliders_bbox')
+    
+    # Customize textbox (fill, border, border width), indexed by
+    # (text_input_active << 1) | is_customize_selected; editing wins over selection
+    TEXTBOX_STYLES = (
+        ((225, 228, 235), (180, 185, 195), 1),  # Light grey
+        ((240, 245, 255), (150, 160, 200), 2),  # Slightly highlighted
+        ((255, 255, 240), (255, 200, 0), 2),    # Bright with yellow border when editing
+        ((255, 255, 240), (255, 200, 0), 2),
+    )
+    
+    # Top-left of each visible line inside the Customize textbox, relative to the box
+    TEXTBOX_LINE_OFFSETS = ((8, 10), (8, 32), (8, 54))
+    # Wrap width for textbox text: the panel width less box margins and 8px padding each side
+    TEXTBOX_TEXT_WIDTH = SLIDER_WIDTH + 60 - 36
+    
     def __init__(self, player, sound_manager=None):
         self.player = player
         self.sound_manager = sound_manager
@@ -275,17 +486,45 @@ class ControlPanel:
         self.cursor_blink_timer = 0  # For blinking cursor animation
         self.llm_processing = False  # True while waiting for LLM response
         self.llm_status = ""  # Status message ("Processing...", "Error: ...", etc.)
+        self._typed_wrap = (None, None)  # (customize_text, (wrapped lines, cursor x offset))
+        self._typed_surfs = {}  # {typed line: Surface} from the last layout, reused while unchanged
         
-        # Import accessibility settings
-        from accessibility import accessibility
         self.accessibility = accessibility
         
+        # Panel fonts, fetched once instead of looked up on every draw
+        self._font_header = font_header()
+        self._font_text = font_text()
+        self._font_small = font_small()
+        self._font_large = font_large()
+        
+        self.visible = True  # False skips all HUD drawing
+        
+        # Prerendered left panel, rebuilt only when the state it shows changes
+        self._left_cache = None
+        self._left_cache_key = None
+        
+        # Textbox line positions, laid out once per box origin: (origin, positions)
+        self._line_positions = (None, None)
+        
+        # Laid-out top row blit list: (cache key, [(surface, pos), ...])
+        self._top_row_cache = (None, None)
+        # Laid-out right panel: (cache key, ([(surface, pos), ...], cursor line or None))
+        self._right_panel_cache = (None, None)
+        # Composited slider column: (cache key, (Surface, screen pos))
+        self._slider_cache = (None, None)
+        # Composited static part of the Customize/Reset section: (cache key, Surface)
+        self._customize_cache = (None, None)
+        
+        # Bake every registered character's face and wrap its description up front, so
+        # switching characters never does either mid-frame (new CHARACTERS entries included)
+        for profile in CHARACTERS.values():
+            _get_face_surface(profile)
+            _wrap_description(self._font_text, profile.description, self.TEXTBOX_TEXT_WIDTH)
+        
         self.create_sliders()
         
     def create_sliders(self):
         """Create sliders for physics widget"""
-        from ui_theme import RIGHT_PANEL_Y, SLIDER_WIDTH, MARGIN_RIGHT
-        
         self.sliders = []
         profile = self.player.profile
         
@@ -301,6 +540,15 @@ class ControlPanel:
         self.sliders.append(Slider(x_start, y_start + 3*spacing, 155, 10, 0.05, 2.5, profile.acceleration, "Accel", "acceleration"))
         self.sliders.append(Slider(x_start, y_start + 4*spacing, 155, 10, 5.0, 20.0, profile.jump_force, "Jump", "jump_force"))
         
+        self._dragging = []  # Indices of sliders mid-drag, updated on button events
+        
+        # Flat [track, handle, track, handle, ...] list for one-call mouse hit tests.
+        # handle_rect is moved in place, so these references stay valid.
+        self._slider_hit_rects = [r for slider in self.sliders for r in (slider.rect, slider.handle_rect)]
+        # Box around every track plus the handle overhang at either end, for a cheap click pre-check
+        tracks = [slider.rect for slider in self.sliders]
+        self._sliders_bbox = tracks[0].unionall(tracks[1:]).inflate(self.sliders[0].handle_width, 4)
+        
         # Volume slider not in this panel
         self.volume_slider_index = len(self.sliders)
         
@@ -327,8 +575,6 @@ class ControlPanel:
     
     def adjust_visuals(self, direction):
         """Adjust selected SETTINGS option."""
-        from ui_theme import theme
-        
         if self.visuals_selected == 0:  # Color Blind
             mode = self.accessibility.cycle_mode(direction)
             print(f"Color Blind mode: {mode}")
@@ -402,6 +648,20 @@ class ControlPanel:
         
         return False
     
+    @property
+    def customize_text(self):
+        """User's typed text, joined from the keystroke buffer only after it changes."""
+        if self._customize_dirty:
+            self._customize_text = "".join(self._customize_buf)
+            self._customize_dirty = False
+        return self._customize_text
+    
+    @customize_text.setter
+    def customize_text(self, text):
+        self._customize_buf = list(text)
+        self._customize_text = text
+        self._customize_dirty = False
+    
     def handle_text_input(self, event):
         """Handle keyboard input when text input mode is active."""
         if not self.text_input_active:
@@ -427,21 +687,22 @@ class ControlPanel:
         
         elif event.key == pygame.K_BACKSPACE:
             # Delete last character
-            self.customize_text = self.customize_text[:-1]
+            if self._customize_buf:
+                self._customize_buf.pop()
+                self._customize_dirty = True
             return True
         
         elif event.unicode and event.unicode.isprintable():
             # Add character (limit length)
-            if len(self.customize_text) < 60:
-                self.customize_text += event.unicode
+            if len(self._customize_buf) < 60:
+                self._customize_buf.append(event.unicode)
+                self._customize_dirty = True
             return True
         
         return True
     
     def _submit_to_llm(self):
         """Submit text to LLM for processing."""
-        import llm_physics
-        
         self.llm_processing = True
         self.llm_status = "Processing..."
         self.text_input_active = False
@@ -459,7 +720,22 @@ class ControlPanel:
         llm_physics.process_description(self.customize_text, callback=on_llm_response)
 
     def handle_event(self, event):
-        for i, slider in enumerate(self.sliders):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if not self._sliders_bbox.collidepoint(event.pos):
+                return
+            # Only sliders under the cursor react to a click: hit-test all rects in one call
+            probe = pygame.Rect(event.pos, (1, 1))
+            targets = sorted({i // 2 for i in probe.collidelistall(self._slider_hit_rects)})
+        elif event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONUP):
+            # Motion and release only matter to a slider that is mid-drag
+            targets = self._dragging
+            if not targets:
+                return  # Hover motion with nothing grabbed
+        else:
+            return  # Sliders ignore every other event type
+        
+        for i in targets:
+            slider = self.sliders[i]
             if i == self.volume_slider_index:
                 # Handle volume slider with None profile
                 old_val = slider.get_value()
@@ -469,80 +745,76 @@ class ControlPanel:
                     self.sound_manager.set_volume(new_val / 100.0)
             else:
                 slider.handle_event(event, self.player.profile)
+        
+        if event.type != pygame.MOUSEMOTION:
+            # Only clicks and releases change which sliders are grabbed
+            self._dragging = [i for i, slider in enumerate(self.sliders) if slider.dragging]
 
     def draw_left_panel(self, surface, keybindings):
         """Draw left panel with Abilities, Controls, Accessibility sections"""
-        from ui_theme import (font_header, font_text, font_small, get_colors, theme,
-                              LEFT_PANEL_X, LEFT_PANEL_Y, LEFT_PANEL_WIDTH,
-                              SPACING_LINE, SPACING_ITEM, SPACING_SECTION,
-                              draw_widget_background)
-        
+        # The panel only changes with this state, so static frames are a single blit
+        key = (_ability_labels(self.player.profile),
+               self.visuals_adjust_mode, self.visuals_selected,
+               self.accessibility.colorblind_mode, theme.current, int(self.sound_volume * 100))
+        if key != self._left_cache_key:
+            # Text can run past the widget box (e.g. three abilities push the Sound
+            # line below it), so the layer is sized to cover everything laid out
+            blits = self._layout_left_panel()
+            width = max(pos[0] + surf.get_width() for surf, pos in blits)
+            height = max(pos[1] + surf.get_height() for surf, pos in blits)
+            layer = pygame.Surface((width, height), pygame.SRCALPHA)
+            layer.blits(blits, doreturn=0)
+            self._left_cache = to_display_alpha(layer)
+            self._left_cache_key = key
+        surface.blit(self._left_cache, (LEFT_PANEL_X, LEFT_PANEL_Y))
+    
+    def _layout_left_panel(self):
+        """Build the left panel's (surface, position) list, relative to the panel's top-left."""
         colors = get_colors()
         profile = self.player.profile
         
-        # Draw boxed widget background
-        widget_height = 340
-        draw_widget_background(surface, LEFT_PANEL_X, LEFT_PANEL_Y, LEFT_PANEL_WIDTH, widget_height)
+        blits = []
+        add = blits.append
+        
+        # Boxed widget background
+        add((get_widget_background(LEFT_PANEL_WIDTH, LEFT_PANEL_HEIGHT), (0, 0)))
         
-        x = LEFT_PANEL_X + 10
-        y = LEFT_PANEL_Y + 12
+        x = 10
+        y = 12
         
         # === ABILITIES ===
-        header = font_header().render("ABILITIES", True, colors['header_red'])
-        surface.blit(header, (x, y))
+        header = _render_cached(self._font_header, "ABILITIES", colors['header_red'])
+        add((header, (x, y)))
         y += SPACING_ITEM
         
-        abilities = []
-        if profile.variable_jump:
-            abilities.append("Variable Jump")
-        if profile.has_momentum:
-            abilities.append("Momentum")
-        if profile.has_wall_jump:
-            abilities.append("Wall Jump")
-        if profile.has_double_jump:
-            abilities.append("Double Jump")
-        if profile.has_dash:
-            abilities.append("Dash")
-        
-        for ability in abilities[:3]:  # Limit to 3 for space
-            txt = font_text().render(f"• {ability}", True, colors['text_bright'])
-            surface.blit(txt, (x, y))
+        for ability in _ability_labels(profile)[:3]:  # Limit to 3 for space
+            txt = _render_cached(self._font_text, f"• {ability}", colors['text_bright'])
+            add((txt, (x, y)))
             y += SPACING_LINE - 2
         
         y += SPACING_SECTION
         
         # === CONTROLS ===
-        header = font_header().render("CONTROLS", True, colors['header_red'])
-        surface.blit(header, (x, y))
+        header = _render_cached(self._font_header, "CONTROLS", colors['header_red'])
+        add((header, (x, y)))
         y += SPACING_ITEM
         
-        # Controls with icons
-        # Move: Stick / D-Pad (text only)
-        txt = font_text().render("Move: Stick / D-Pad", True, colors['text_bright'])
-        surface.blit(txt, (x, y))
-        y += SPACING_LINE - 2
-        
-        # Jump: [X icon] - 1.5x size for visibility
-        txt = font_text().render("Jump:", True, colors['text_bright'])
-        surface.blit(txt, (x, y))
-        btn_size = int(txt.get_height() * 1.5)
-        draw_ps5_button(surface, x + txt.get_width() + 5, y - (btn_size - txt.get_height()) // 2, 'x', btn_size)
-        y += SPACING_LINE - 2
-        
-        # Run/Dash: [Square icon] - 1.5x size for visibility
-        txt = font_text().render("Run/Dash:", True, colors['text_bright'])
-        surface.blit(txt, (x, y))
-        btn_size = int(txt.get_height() * 1.5)
-        draw_ps5_button(surface, x + txt.get_width() + 5, y - (btn_size - txt.get_height()) // 2, 'square', btn_size)
-        y += SPACING_LINE - 2
+        # Controls with icons, 1.5x text height for visibility
+        for label, button in _CONTROL_ROWS:
+            txt = _render_cached(self._font_text, label, colors['text_bright'])
+            add((txt, (x, y)))
+            if button is not None:
+                btn_size = int(txt.get_height() * 1.5)
+                add(_ps5_button_blit(x + txt.get_width() + 5, y - (btn_size - txt.get_height()) // 2, button, btn_size)[0])
+            y += SPACING_LINE - 2
         
         y += SPACING_SECTION
         
         # === SETTINGS with L1 icon ===
         header_color = colors['header_orange'] if self.visuals_adjust_mode else colors['header_red']
-        header = font_header().render("SETTINGS", True, header_color)
-        surface.blit(header, (x, y))
-        draw_ps5_button(surface, x + header.get_width() + 8, y, 'l1', header.get_height())
+        header = _render_cached(self._font_header, "SETTINGS", header_color)
+        add((header, (x, y)))
+        add(_ps5_button_blit(x + header.get_width() + 8, y, 'l1', header.get_height())[0])
         y += SPACING_ITEM
         
         # Color Blind toggle (index 0)
@@ -550,10 +822,10 @@ class ControlPanel:
         color = colors['highlight'] if is_selected else colors['text_bright']
         cb_value = self.accessibility.colorblind_mode
         if is_selected:
-            txt = font_text().render(f"< Color Blind: {cb_value} >", True, color)
+            txt = _render_cached(self._font_text, f"< Color Blind: {cb_value} >", color)
         else:
-            txt = font_text().render(f"Color Blind: {cb_value}", True, color)
-        surface.blit(txt, (x, y))
+            txt = _render_cached(self._font_text, f"Color Blind: {cb_value}", color)
+        add((txt, (x, y)))
         y += SPACING_LINE
         
         # Light/Dark toggle (index 1)
@@ -561,10 +833,10 @@ class ControlPanel:
         color = colors['highlight'] if is_selected else colors['text_bright']
         theme_value = theme.current
         if is_selected:
-            txt = font_text().render(f"< Theme: {theme_value} >", True, color)
+            txt = _render_cached(self._font_text, f"< Theme: {theme_value} >", color)
         else:
-            txt = font_text().render(f"Theme: {theme_value}", True, color)
-        surface.blit(txt, (x, y))
+            txt = _render_cached(self._font_text, f"Theme: {theme_value}", color)
+        add((txt, (x, y)))
         y += SPACING_LINE
         
         # Sound volume (index 2)
@@ -573,34 +845,70 @@ class ControlPanel:
         # Get volume as percentage (0-100)
         volume_pct = int(self.sound_volume * 100)
         if is_selected:
-            txt = font_text().render(f"< Sound: {volume_pct}% >", True, color)
+            txt = _render_cached(self._font_text, f"< Sound: {volume_pct}% >", color)
         else:
-            txt = font_text().render(f"Sound: {volume_pct}%", True, color)
-        surface.blit(txt, (x, y))
+            txt = _render_cached(self._font_text, f"Sound: {volume_pct}%", color)
+        add((txt, (x, y)))
+        
+        return blits
 
 
 
-    def draw_character_face(self, surface, x, y, profile):
-        """Draws a simple 8x8 pixel art face scaled up"""
-        scale = 4
-        pixels, color_map = get_face_data(profile.name, profile.color)
-        
-        # Draw
-        for row in range(8):
-            for col in range(8):
-                if row < len(pixels) and col < len(pixels[row]):
-                    char = pixels[row][col]
-                    color = color_map.get(char, profile.color)
-                    if color:
-                        pygame.draw.rect(surface, color, (x + col*scale, y + row*scale, scale, scale))
+    def _textbox_line_positions(self, box_x, box_y):
+        """Screen positions of the textbox's visible lines, computed once per box origin."""
+        origin = (box_x, box_y)
+        if self._line_positions[0] != origin:
+            self._line_positions = (origin, tuple((box_x + dx, box_y + dy)
+                                                  for dx, dy in self.TEXTBOX_LINE_OFFSETS))
+        return self._line_positions[1]
+    
+    def _wrap_typed_text(self, font, max_width):
+        """Wrapped customize_text lines and cursor offset, recomputed only when the text changes."""
+        text = self.customize_text
+        old_text, old_wrap = self._typed_wrap
+        if old_text != text:
+            if old_text and text.startswith(old_text):
+                # Typing appends, and greedy wrapping never moves words onto earlier
+                # lines, so only the last line needs re-wrapping with the new tail
+                old_lines = old_wrap[0]
+                sep = " " if old_text[-1].isspace() else ""
+                tail = old_lines[-1] + sep + text[len(old_text):]
+                lines = old_lines[:-1] + (_wrap_pixels(font, tail, max_width) or [""])
+            else:
+                # Always at least one line, so the cursor has somewhere to sit
+                lines = _wrap_pixels(font, text, max_width) or [""]
+            last_line = lines[-1]
+            # Cursor sits after the space that follows the last word
+            cursor_dx = font.size(last_line + " ")[0] if last_line else 0
+            self._typed_wrap = (text, (lines, cursor_dx))
+        return self._typed_wrap[1]
 
     def draw_right_panel(self, surface, keybindings):
         """Draw settings widget on right side - one unified panel"""
-        from ui_theme import (font_header, font_text, font_small, get_colors, theme,
-                              MARGIN_RIGHT, SPACING_ITEM, RIGHT_PANEL_Y,
-                              SLIDER_WIDTH, draw_widget_background)
+        if self.text_input_active:
+            self.cursor_blink_timer = (self.cursor_blink_timer + 1) % 60
         
+        # Nothing on the panel changes between frames unless this state does; in
+        # between, the laid-out blit list is reused as-is
+        profile = self.player.profile
+        key = (theme.current, profile, profile.description,
+               self.physics_adjust_mode, self.selected_slider,
+               tuple((slider.getter(profile), slider.handle_rect.x, slider.dragging)
+                     for i, slider in enumerate(self.sliders) if i != self.volume_slider_index),
+               self.text_input_active, self.customize_text, self.cursor_blink_timer < 30,
+               self.llm_processing, self.llm_status)
+        if key != self._right_panel_cache[0]:
+            self._right_panel_cache = (key, self._layout_right_panel(profile))
+        blits, cursor = self._right_panel_cache[1]
+        surface.blits(blits, doreturn=0)
+        if cursor is not None:
+            pygame.draw.line(surface, (0, 0, 0), cursor[0], cursor[1], 2)
+    
+    def _layout_right_panel(self, profile):
+        """Build the right panel's (surface, position) list and cursor line (or None)."""
+        # Only these two theme colors are used here; read them once
         colors = get_colors()
+        header_blue, text_dim = colors['header_blue'], colors['text_dim']
         
         # === ONE UNIFIED PANEL ===
         widget_x = SCREEN_WIDTH - SLIDER_WIDTH - MARGIN_RIGHT - 45
@@ -609,15 +917,18 @@ class ControlPanel:
         # Calculate total height for sliders + customize + reset
         total_height = 400  # Enough for sliders + customize box + reset
         
-        # Draw single unified background
-        draw_widget_background(surface, widget_x, widget_y, widget_width, total_height)
+        blits = []
+        add = blits.append
+        cursor = None  # Blinking text cursor line, drawn after the text
+        
+        # Single unified background
+        add((get_widget_background(widget_width, total_height), (widget_x, widget_y)))
         
         # === SLIDERS ===
-        for i, slider in enumerate(self.sliders):
-            is_highlighted = self.physics_adjust_mode and i == self.selected_slider
-            if i == self.volume_slider_index:
-                continue  # Skip volume slider in this panel
-            slider.draw(surface, self.player.profile, highlighted=is_highlighted)
+        visible = [(slider, self.physics_adjust_mode and i == self.selected_slider)
+                   for i, slider in enumerate(self.sliders)
+                   if i != self.volume_slider_index]  # Skip volume slider in this panel
+        add(self._slider_layer(visible, profile))
         
         # === CUSTOMIZE SECTION ===
         customize_y = widget_y + 225  # After sliders
@@ -625,79 +936,48 @@ class ControlPanel:
         # Check if Customize is selected
         is_customize_selected = self.physics_adjust_mode and self.selected_slider == self.customize_index
         
-        # Header "Customize" - highlight when selected
-        if is_customize_selected or self.text_input_active:
-            customize_color = (255, 220, 100)  # Yellow when selected
-        else:
-            customize_color = colors['header_blue']
-        customize_txt = font_header().render("Customize", True, customize_color)
-        surface.blit(customize_txt, (widget_x + 12, customize_y))
-        
-        # Show X button hint when selected
-        if is_customize_selected and not self.text_input_active:
-            hint_txt = font_small().render("Press", True, colors['text_dim'])
-            surface.blit(hint_txt, (widget_x + 12 + customize_txt.get_width() + 8, customize_y + 4))
-            draw_ps5_button(surface, widget_x + 12 + customize_txt.get_width() + 8 + hint_txt.get_width() + 4, customize_y, 'x', customize_txt.get_height())
-        
-        # Light grey text box for description
+        # Header, hint, empty textbox and Reset line depend only on the theme and the
+        # textbox style, so they're composited once per combination
         textbox_y = customize_y + 30
-        textbox_height = 75
+        style = (bool(self.text_input_active) << 1) | bool(is_customize_selected)
+        key = (theme.current, style)
+        if key != self._customize_cache[0]:
+            self._customize_cache = (key, self._render_customize_section(
+                style, widget_width, total_height - (customize_y - widget_y), header_blue, text_dim))
+        add((self._customize_cache[1], (widget_x, customize_y)))
         
-        # Textbox color changes based on state
-        if self.text_input_active:
-            textbox_color = (255, 255, 240)  # Bright when editing
-            border_color = (255, 200, 0)  # Yellow border
-            border_width = 2
-        elif is_customize_selected:
-            textbox_color = (240, 245, 255)  # Slightly highlighted
-            border_color = (150, 160, 200)
-            border_width = 2
-        else:
-            textbox_color = (225, 228, 235)  # Light grey
-            border_color = (180, 185, 195)
-            border_width = 1
-        
-        pygame.draw.rect(surface, textbox_color, 
-                        (widget_x + 10, textbox_y, widget_width - 20, textbox_height))
-        pygame.draw.rect(surface, border_color, 
-                        (widget_x + 10, textbox_y, widget_width - 20, textbox_height), border_width)
+        # Screen position of each visible text line inside the box
+        line_positions = self._textbox_line_positions(widget_x + 10, textbox_y)
         
         # Determine what text to show
         if self.text_input_active or self.customize_text:
             # Show user's typed text
-            display_text = self.customize_text
             text_color = (30, 30, 40)  # Dark text
+            font = self._font_text
             
-            # Word wrap the text
-            desc_lines = []
-            words = display_text.split() if display_text else []
-            line = ""
-            for word in words:
-                if len(line + word) < 22:
-                    line += word + " "
-                else:
-                    desc_lines.append(line)
-                    line = word + " "
-            if line or not words:
-                desc_lines.append(line)
+            # Word wrap to the textbox's inner width
+            desc_lines, cursor_dx = self._wrap_typed_text(font, self.TEXTBOX_TEXT_WIDTH)
             
-            text_y = textbox_y + 10
-            for i, line in enumerate(desc_lines[:3]):
-                txt = font_text().render(line, True, text_color)
-                surface.blit(txt, (widget_x + 18, text_y))
-                text_y += 22
+            # Typed text changes every keystroke, so it stays out of the shared text
+            # cache; typing only edits the last line, and a cursor blink edits none,
+            # so every other line keeps its surface from the previous layout
+            old_surfs = self._typed_surfs
+            typed_surfs = {}
+            for line, pos in zip(desc_lines, line_positions):  # Stops at the visible line count
+                surf = old_surfs.get(line)
+                if surf is None:
+                    surf = font.render(line, True, text_color)
+                typed_surfs[line] = surf
+                add((surf, pos))
+            self._typed_surfs = typed_surfs
             
             # Draw blinking cursor when active
             if self.text_input_active:
-                self.cursor_blink_timer = (self.cursor_blink_timer + 1) % 60
                 if self.cursor_blink_timer < 30:
                     # Calculate cursor position
-                    last_line = desc_lines[-1] if desc_lines else ""
-                    cursor_x = widget_x + 18 + font_text().size(last_line)[0]
+                    cursor_x = widget_x + 18 + cursor_dx
                     cursor_y = textbox_y + 10 + (len(desc_lines) - 1) * 22
-                    pygame.draw.line(surface, (0, 0, 0), 
-                                    (cursor_x, cursor_y), 
-                                    (cursor_x, cursor_y + 18), 2)
+                    cursor = ((cursor_x, cursor_y), (cursor_x, cursor_y + 18))
         
         elif self.llm_processing or self.llm_status:
             # Show LLM status
@@ -711,186 +991,260 @@ class ControlPanel:
                 status_text = self.llm_status
                 status_color = (100, 200, 100)
             
-            txt = font_text().render(status_text, True, status_color)
-            surface.blit(txt, (widget_x + 18, textbox_y + 28))
+            txt = _render_cached(self._font_text, status_text, status_color)
+            add((txt, (widget_x + 18, textbox_y + 28)))
         
         else:
             # Show default description
-            profile = self.player.profile
-            desc_lines = []
-            words = profile.description.split()
-            line = ""
-            for word in words:
-                if len(line + word) < 24:
-                    line += word + " "
-                else:
-                    desc_lines.append(line)
-                    line = word + " "
-            if line:
-                desc_lines.append(line)
+            font = self._font_text
+            desc_lines = _wrap_description(font, profile.description, self.TEXTBOX_TEXT_WIDTH)
             
-            text_y = textbox_y + 10
             text_color = (60, 65, 75)  # Dark text on light bg
-            for line in desc_lines[:3]:  # Limit to 3 lines
-                txt = font_text().render(line.strip(), True, text_color)
-                surface.blit(txt, (widget_x + 18, text_y))
-                text_y += 22
+            for line, pos in zip(desc_lines, line_positions):  # Limit to the visible lines
+                add((_render_cached(font, line, text_color), pos))
+        
+        # The static layer goes first so the text lands inside the textbox; the cursor
+        # is drawn over the text
+        return blits, cursor
+
+    def _slider_layer(self, visible, profile):
+        """(Surface, pos) with every visible slider composited, redrawn only when one changes."""
+        labels = [slider.get_label_surface(profile, hl) for slider, hl in visible]
+        # Label surfaces are cached per displayed value, so identity tracks the text
+        key = tuple((label, slider.handle_rect.x, hl, slider.dragging)
+                    for label, (slider, hl) in zip(labels, visible))
+        if key != self._slider_cache[0]:
+            # Labels, then tracks, then handles on top, as separate passes would draw them
+            items = [(label, slider.get_label_pos()) for label, (slider, _) in zip(labels, visible)]
+            items += [(slider.get_track_surface(hl), slider.get_track_pos()) for slider, hl in visible]
+            rects = [surf.get_rect(topleft=pos) for surf, pos in items]
+            bounds = rects[0].unionall(rects[1:])
+            layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            layer.blits([(surf, rect.move(-bounds.x, -bounds.y)) for (surf, _), rect in zip(items, rects)],
+                        doreturn=0)
+            for slider, hl in visible:
+                slider.draw_handle(layer, hl, bounds.topleft)
+            self._slider_cache = (key, (to_display_alpha(layer), bounds.topleft))
+        return self._slider_cache[1]
+    
+    def _render_customize_section(self, style, width, height, header_blue, text_dim):
+        """Composite the Customize header and hint, the empty textbox and the Reset line onto one layer."""
+        layer = pygame.Surface((width, height), pygame.SRCALPHA)
+        blits = []
+        add = blits.append
+        
+        # Header "Customize" - highlight when selected
+        if style:
+            customize_color = (255, 220, 100)  # Yellow when selected
+        else:
+            customize_color = header_blue
+        customize_txt = _render_cached(self._font_header, "Customize", customize_color)
+        add((customize_txt, (12, 0)))
+        
+        # Show X button hint when selected but not yet typing
+        if style == 1:
+            hint_txt = _render_cached(self._font_small, "Press", text_dim)
+            add((hint_txt, (12 + customize_txt.get_width() + 8, 4)))
+            add(_ps5_button_blit(12 + customize_txt.get_width() + 8 + hint_txt.get_width() + 4, 0, 'x', customize_txt.get_height())[0])
+        
+        # Light grey text box for description
+        textbox_y = 30
+        textbox_height = 75
+        
+        # Textbox color changes based on state
+        textbox_color, border_color, border_width = self.TEXTBOX_STYLES[style]
+        pygame.draw.rect(layer, textbox_color, (10, textbox_y, width - 20, textbox_height))
+        pygame.draw.rect(layer, border_color, (10, textbox_y, width - 20, textbox_height), border_width)
         
         # === RESET SECTION ===
-        reset_y = textbox_y + textbox_height + 15
-        reset_color = colors['header_blue']
+        add((self._render_reset_row(header_blue, text_dim), (12, textbox_y + textbox_height + 15)))
         
-        reset_txt = font_header().render("Reset", True, reset_color)
-        surface.blit(reset_txt, (widget_x + 12, reset_y))
+        # Nothing here overlaps, so compositing onto a transparent layer is exact
+        layer.blits(blits, doreturn=0)
+        return to_display_alpha(layer)
+    
+    def _render_reset_row(self, reset_color, text_dim):
+        """Composite the "Reset  Press R1 + Triangle" line onto one surface."""
+        x = y = 0
+        blits = []
+        add = blits.append
+        
+        reset_txt = _render_cached(self._font_header, "Reset", reset_color)
+        add((reset_txt, (x, y)))
         
         # Draw R1 + Triangle icons - sized to match Reset text height
         icon_size = reset_txt.get_height()
-        icon_x = widget_x + 12 + reset_txt.get_width() + 12
-        icon_y = reset_y
+        icon_x = x + reset_txt.get_width() + 12
+        icon_y = y
         
         # "Press" text
-        press_txt = font_small().render("Press", True, colors['text_dim'])
-        surface.blit(press_txt, (icon_x, icon_y + (icon_size - press_txt.get_height()) // 2))
+        press_txt = _render_cached(self._font_small, "Press", text_dim)
+        add((press_txt, (icon_x, icon_y + (icon_size - press_txt.get_height()) // 2)))
         icon_x += press_txt.get_width() + 5
         
         # R1 button
-        r1_width = draw_ps5_button(surface, icon_x, icon_y, 'r1', icon_size)
+        r1_item, r1_width = _ps5_button_blit(icon_x, icon_y, 'r1', icon_size)
+        add(r1_item)
         icon_x += r1_width + 2
         
         # + text
-        plus_txt = font_small().render("+", True, colors['text_dim'])
-        surface.blit(plus_txt, (icon_x, icon_y + (icon_size - plus_txt.get_height()) // 2))
+        plus_txt = _render_cached(self._font_small, "+", text_dim)
+        add((plus_txt, (icon_x, icon_y + (icon_size - plus_txt.get_height()) // 2)))
         icon_x += plus_txt.get_width() + 2
         
         # Triangle button
-        draw_ps5_button(surface, icon_x, icon_y, 'triangle', icon_size)
+        add(_ps5_button_blit(icon_x, icon_y, 'triangle', icon_size)[0])
+        
+        # Nothing overlaps, so compositing onto a transparent layer is exact
+        bounds = pygame.Rect(0, 0, 0, 0).unionall([surf.get_rect(topleft=pos) for surf, pos in blits])
+        layer = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        layer.blits(blits, doreturn=0)
+        return to_display_alpha(layer)
 
     def draw_top_row(self, surface, playground):
         """Draw top row: Character (L2) | Level (R2) | PHYSICS (R1)"""
-        from ui_theme import (font_header, font_large, font_text, get_colors,
-                              TOP_ROW_Y, MARGIN_LEFT, MARGIN_RIGHT)
-        
+        profile = self.player.profile
+        level_index = playground.current_playground if playground else None
+        # The row only changes with the character, the level and the theme; in between,
+        # the laid-out blit list is reused as-is
+        key = (profile.name, tuple(profile.color), level_index, theme.current)
+        if key != self._top_row_cache[0]:
+            self._top_row_cache = (key, self._layout_top_row(profile, playground))
+        surface.blits(self._top_row_cache[1], doreturn=0)
+    
+    def _layout_top_row(self, profile, playground):
+        """Build the top row's (surface, position) list."""
         colors = get_colors()
         y = TOP_ROW_Y
+        blits = []
+        add = blits.append
         
         # === LEFT: Character name with face ===
         x = MARGIN_LEFT
-        profile = self.player.profile
-        self.draw_character_face(surface, x, y - 5, profile)
+        add((_get_face_surface(profile), (x, y - 5)))
         
         # Character name
-        name_surf = font_header().render(profile.name, True, profile.color)
-        surface.blit(name_surf, (x + 42, y))
+        name_surf = _render_cached(self._font_header, profile.name, profile.color)
+        add((name_surf, (x + 42, y)))
         
         # L2 icon hint - sized to match name text height
-        draw_ps5_button(surface, x + 45 + name_surf.get_width() + 10, y, 'l2', name_surf.get_height())
+        add(_ps5_button_blit(x + 45 + name_surf.get_width() + 10, y, 'l2', name_surf.get_height())[0])
         
         # === CENTER: Level name ===
         if playground:
             level_name = playground.get_name().upper()
-            level_surf = font_large().render(level_name, True, colors['text_bright'])
+            level_surf = _render_cached(self._font_large, level_name, colors['text_bright'])
             level_rect = level_surf.get_rect(center=(SCREEN_WIDTH // 2, y + 10))
-            surface.blit(level_surf, level_rect)
+            add((level_surf, level_rect))
             
             # R2 icon hint - sized to match level text height
-            draw_ps5_button(surface, level_rect.right + 10, level_rect.top, 'r2', level_surf.get_height())
+            add(_ps5_button_blit(level_rect.right + 10, level_rect.top, 'r2', level_surf.get_height())[0])
         
         # === RIGHT: PHYSICS header ===
-        physics_txt = font_header().render("PHYSICS", True, colors['header_blue'])
-        physics_x = SCREEN_WIDTH - MARGIN_RIGHT - physics_txt.get_width() - 50
-        surface.blit(physics_txt, (physics_x, y))
+        physics_txt = _render_cached(self._font_header, "PHYSICS", colors['header_blue'])
+        physics_w = physics_txt.get_width()
+        physics_x = SCREEN_WIDTH - MARGIN_RIGHT - physics_w - 50
+        add((physics_txt, (physics_x, y)))
         
         # R1 icon hint - sized to match PHYSICS text height
-        draw_ps5_button(surface, physics_x + physics_txt.get_width() + 5, y, 'r1', physics_txt.get_height())
+        add(_ps5_button_blit(physics_x + physics_w + 5, y, 'r1', physics_txt.get_height())[0])
+        return blits
 
     def draw(self, surface, keybindings, playground=None):
         """Draw UI panels with top row layout"""
+        if not self.visible:
+            return
         self.draw_top_row(surface, playground)
         self.draw_left_panel(surface, keybindings)
         self.draw_right_panel(surface, keybindings)
 
-def draw_level_selector(surface, playground, keybindings):
-    """Draw current level name at top center (simplified)"""
-    font_header = pygame.font.SysFont(None, 22, bold=True)
-    
-    # Just show current level name
-    level_name = playground.get_name()
-    center_x = SCREEN_WIDTH // 2
-    
-    # Draw level name centered
-    name_surf = font_header.render(level_name, True, (100, 200, 255))
-    name_rect = name_surf.get_rect(center=(center_x, 25))
-    surface.blit(name_surf, name_rect)
+def draw_controller_status(surface):
+    """Draw the controller status line at the bottom-left (per mockup)."""
+    # The text cache keys on color, so a theme change picks up the new text_dim shade
+    txt = _render_cached(font_text(), "Wireless Controller: Connected", get_colors()['text_dim'])
+    surface.blit(txt, (MARGIN_LEFT, SCREEN_HEIGHT - 30))  # 30px up from the bottom edge
 
-def draw_selection_overlay(surface, mode_type, current_index, items):
-    """
-    Draw a large overlay for Character (LT) or Level (RT) selection
-    mode_type: "CHARACTER" or "LEVEL"
-    current_index: index of currently highlighted item
-    items: list of (name, color, description) or similar info
-    """
+# Last prerendered overlay, dimming included: ((mode_type, current_index, item names), Surface).
+# One full-screen layer, rebuilt when the selection moves, rather than one per index ever shown
+_overlay_cache = (None, None)
+
+
+def _render_selection_overlay(mode_type, current_index, names):
+    """Render the dimmed background, header, items and helper text onto one full-screen layer."""
+    layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
     # Semi-transparent background
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    surface.blit(overlay, (0, 0))
+    layer.fill((0, 0, 0, 180))
     
-    font_header = pygame.font.SysFont(None, 48, bold=True)
-    font_item = pygame.font.SysFont(None, 36)
-    font_desc = pygame.font.SysFont(None, 24)
+    font_header = get_font(48, bold=True)
+    font_item = get_font(36)
+    font_desc = get_font(24)
     
     # Header
     color = (255, 220, 100) if mode_type == "CHARACTER" else (100, 200, 255)
-    header = font_header.render(f"SELECT {mode_type}", True, color)
+    header = _render_cached(font_header, f"SELECT {mode_type}", color)
     header_rect = header.get_rect(center=(SCREEN_WIDTH // 2, 80))
-    surface.blit(header, header_rect)
+    layer.blit(header, header_rect)
     
     # Draw items in a vertical list or grid
     start_y = 150
     spacing = 50
     
-    for i, item in enumerate(items):
-        name = item['name']
-        
+    for i, name in enumerate(names):
         # Highlight current selection
         if i == current_index:
             item_color = (255, 255, 255)
             # Arrow or Box
-            arrow = font_item.render(">", True, (255, 255, 0))
-            surface.blit(arrow, (SCREEN_WIDTH // 2 - 150, start_y + i * spacing))
+            arrow = _render_cached(font_item, ">", (255, 255, 0))
+            layer.blit(arrow, (SCREEN_WIDTH // 2 - 150, start_y + i * spacing))
         else:
             item_color = (150, 150, 150)
             
-        text = font_item.render(name, True, item_color)
+        text = _render_cached(font_item, name, item_color)
         rect = text.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * spacing))
-        surface.blit(text, rect)
+        layer.blit(text, rect)
         
     # Helper Text
-    helper = font_desc.render("Use D-Pad to Select • Release Trigger to Confirm", True, (200, 200, 200))
+    helper = _render_cached(font_desc, "Use D-Pad to Select • Release Trigger to Confirm", (200, 200, 200))
     helper_rect = helper.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
-    surface.blit(helper, helper_rect)
+    layer.blit(helper, helper_rect)
+    return to_display_alpha(layer)
 
 
-def draw_pause_screen(surface):
-    """Draw the pause/help screen overlay."""
+def draw_selection_overlay(surface, mode_type, current_index, items):
+    """
+    Draw a large overlay for Character (LT) or Level (RT) selection
+    mode_type: "CHARACTER" or "LEVEL"
+    current_index: index of currently highlighted item
+    items: list of (name, color, description) or similar info
+    """
+    # Only changes when the selection moves, so reuse the rendered layer
+    global _overlay_cache
+    key = (mode_type, current_index, tuple(item['name'] for item in items))
+    if key != _overlay_cache[0]:
+        _overlay_cache = (key, _render_selection_overlay(mode_type, current_index, key[2]))
+    surface.blit(_overlay_cache[1], (0, 0))
+
+
+def _render_pause_screen():
+    """Render the (fully static) pause/help screen, dimming included, onto one full-screen layer."""
+    surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
     # Semi-transparent overlay
-    overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 200))
-    surface.blit(overlay, (0, 0))
+    surface.fill((0, 0, 0, 200))
     
     # Fonts
-    font_title = pygame.font.SysFont(None, 48, bold=True)
-    font_header = pygame.font.SysFont(None, 28, bold=True)
-    font_text = pygame.font.SysFont(None, 20)
+    font_title = get_font(48, bold=True)
+    font_header = get_font(28, bold=True)
+    font_text = get_font(20)
     
     # Title
-    title = font_title.render("PAUSE / HELP", True, (255, 255, 100))
+    title = _render_cached(font_title, "PAUSE / HELP", (255, 255, 100))
     title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 40))
     surface.blit(title, title_rect)
     
     y = 80
     
     # === CONTROLS SECTION ===
-    controls_header = font_header.render("CONTROLS", True, (100, 200, 255))
+    controls_header = _render_cached(font_header, "CONTROLS", (100, 200, 255))
     surface.blit(controls_header, (50, y))
     y += 30
     
@@ -906,8 +1260,8 @@ def draw_pause_screen(surface):
     ]
     
     for button, desc in controls:
-        btn_surf = font_text.render(button, True, (255, 220, 100))
-        desc_surf = font_text.render(desc, True, (200, 200, 200))
+        btn_surf = _render_cached(font_text, button, (255, 220, 100))
+        desc_surf = _render_cached(font_text, desc, (200, 200, 200))
         surface.blit(btn_surf, (60, y))
         surface.blit(desc_surf, (250, y))
         y += 22
@@ -915,7 +1269,7 @@ def draw_pause_screen(surface):
     y += 15
     
     # === PHYSICS SECTION ===
-    physics_header = font_header.render("PHYSICS SETTINGS", True, (100, 255, 150))
+    physics_header = _render_cached(font_header, "PHYSICS SETTINGS", (100, 255, 150))
     surface.blit(physics_header, (50, y))
     y += 30
     
@@ -928,8 +1282,8 @@ def draw_pause_screen(surface):
     ]
     
     for param, desc in physics:
-        param_surf = font_text.render(param, True, (150, 255, 150))
-        desc_surf = font_text.render(desc, True, (200, 200, 200))
+        param_surf = _render_cached(font_text, param, (150, 255, 150))
+        desc_surf = _render_cached(font_text, desc, (200, 200, 200))
         surface.blit(param_surf, (60, y))
         surface.blit(desc_surf, (150, y))
         y += 22
@@ -937,6 +1291,19 @@ def draw_pause_screen(surface):
     y += 20
     
     # Footer
-    footer = font_text.render("Press Start/Options to resume", True, (180, 180, 180))
+    footer = _render_cached(font_text, "Press Start/Options to resume", (180, 180, 180))
     footer_rect = footer.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 30))
     surface.blit(footer, footer_rect)
+    return to_display_alpha(surface)
+
+
+# Fully rendered pause screen, built on first use
+_PAUSE_SCREEN = None
+
+
+def draw_pause_screen(surface):
+    """Draw the pause/help screen overlay."""
+    global _PAUSE_SCREEN
+    if _PAUSE_SCREEN is None:
+        _PAUSE_SCREEN = _render_pause_screen()
+    surface.blit(_PAUSE_SCREEN, (0, 0))
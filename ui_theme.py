@@ -5,6 +5,8 @@ Supports Dark/Light theme toggle.
 
 import pygame
 
+from render_utils import to_display_alpha
+
 # Initialize pygame font system
 pygame.font.init()
 
@@ -19,14 +21,16 @@ class Theme:
     
     def __init__(self):
         self.current = self.LIGHT  # Light theme default for accessibility
+        self.dark = False  # Kept in step with current so hot paths test a bool, not a string
     
     def toggle(self):
         """Toggle between Dark and Light themes."""
-        self.current = self.LIGHT if self.current == self.DARK else self.DARK
+        self.dark = not self.dark
+        self.current = self.DARK if self.dark else self.LIGHT
         return self.current
     
     def is_dark(self):
-        return self.current == self.DARK
+        return self.dark
 
 # Global theme instance
 theme = Theme()
@@ -48,11 +52,11 @@ FONT_SIZE_TINY = 20        # Hints
 # Cached font objects
 _font_cache = {}
 
-def get_font(size, bold=False):
+def get_font(size, bold=False, italic=False):
     """Get a cached font object."""
-    key = (size, bold)
+    key = (size, bold, italic)
     if key not in _font_cache:
-        _font_cache[key] = pygame.font.SysFont(FONT_FAMILY, size, bold=bold)
+        _font_cache[key] = pygame.font.SysFont(FONT_FAMILY, size, bold=bold, italic=italic)
     return _font_cache[key]
 
 def font_large():
@@ -75,63 +79,66 @@ def font_tiny():
 # COLORS - Theme-aware colors
 # =============================================================================
 
+# Both palettes are built once; treat the returned dicts as read-only
+_DARK_COLORS = {
+    # Background
+    'bg_top': (25, 25, 50),
+    'bg_bottom': (15, 15, 30),
+    'grid': (50, 50, 80),
+    'top_bar_bg': (20, 20, 45, 240),
+
+    # Text - PURE WHITE for maximum readability
+    'text_bright': (255, 255, 255),
+    'text_dim': (220, 220, 220),
+    'text_hint': (180, 180, 180),
+
+    # Headers - bright, saturated
+    'header_blue': (100, 200, 255),
+    'header_red': (255, 100, 100),  # For Abilities, Controls, Accessibility
+    'header_orange': (255, 180, 80),
+    'header_green': (100, 255, 150),
+    'header_purple': (200, 150, 255),
+    'header_yellow': (255, 230, 100),
+
+    # UI elements
+    'slider_track': (70, 70, 100),
+    'slider_handle': (220, 220, 220),
+    'highlight': (255, 255, 120),
+    'widget_bg': (30, 30, 60, 200),
+}
+
+_LIGHT_COLORS = {
+    # Background
+    'bg_top': (220, 225, 235),
+    'bg_bottom': (200, 205, 215),
+    'grid': (180, 185, 195),
+    'top_bar_bg': (240, 242, 248, 240),
+
+    # Text - Dark for light background
+    'text_bright': (30, 30, 40),
+    'text_dim': (60, 60, 70),
+    'text_hint': (100, 100, 110),
+
+    # Headers - darker, saturated (red for section headers per mockup)
+    'header_blue': (30, 100, 160),
+    'header_red': (180, 60, 60),  # For Abilities, Controls, Accessibility
+    'header_orange': (180, 100, 30),
+    'header_green': (30, 130, 70),
+    'header_purple': (100, 60, 160),
+    'header_yellow': (160, 130, 20),
+
+    # UI elements
+    'slider_track': (160, 165, 180),
+    'slider_handle': (100, 100, 120),
+    'highlight': (255, 180, 40),
+    'widget_bg': (250, 252, 255, 240),
+    'widget_border': (180, 185, 200),
+}
+
+
 def get_colors():
-    """Get current theme colors."""
-    if theme.is_dark():
-        return {
-            # Background
-            'bg_top': (25, 25, 50),
-            'bg_bottom': (15, 15, 30),
-            'grid': (50, 50, 80),
-            'top_bar_bg': (20, 20, 45, 240),
-            
-            # Text - PURE WHITE for maximum readability
-            'text_bright': (255, 255, 255),
-            'text_dim': (220, 220, 220),
-            'text_hint': (180, 180, 180),
-            
-            # Headers - bright, saturated
-            'header_blue': (100, 200, 255),
-            'header_red': (255, 100, 100),  # For Abilities, Controls, Accessibility
-            'header_orange': (255, 180, 80),
-            'header_green': (100, 255, 150),
-            'header_purple': (200, 150, 255),
-            'header_yellow': (255, 230, 100),
-            
-            # UI elements
-            'slider_track': (70, 70, 100),
-            'slider_handle': (220, 220, 220),
-            'highlight': (255, 255, 120),
-            'widget_bg': (30, 30, 60, 200),
-        }
-    else:  # Light theme
-        return {
-            # Background
-            'bg_top': (220, 225, 235),
-            'bg_bottom': (200, 205, 215),
-            'grid': (180, 185, 195),
-            'top_bar_bg': (240, 242, 248, 240),
-            
-            # Text - Dark for light background
-            'text_bright': (30, 30, 40),
-            'text_dim': (60, 60, 70),
-            'text_hint': (100, 100, 110),
-            
-            # Headers - darker, saturated (red for section headers per mockup)
-            'header_blue': (30, 100, 160),
-            'header_red': (180, 60, 60),  # For Abilities, Controls, Accessibility
-            'header_orange': (180, 100, 30),
-            'header_green': (30, 130, 70),
-            'header_purple': (100, 60, 160),
-            'header_yellow': (160, 130, 20),
-            
-            # UI elements
-            'slider_track': (160, 165, 180),
-            'slider_handle': (100, 100, 120),
-            'highlight': (255, 180, 40),
-            'widget_bg': (250, 252, 255, 240),
-            'widget_border': (180, 185, 200),
-        }
+    """Get current theme colors (a shared dict, no per-call rebuild)."""
+    return _DARK_COLORS if theme.dark else _LIGHT_COLORS
 
 
 # =============================================================================
@@ -162,6 +169,7 @@ TOP_ROW_Y = 25
 LEFT_PANEL_X = 15
 LEFT_PANEL_Y = 70
 LEFT_PANEL_WIDTH = 180
+LEFT_PANEL_HEIGHT = 340
 
 # Right panel (Physics sliders + description)
 RIGHT_PANEL_X = 824 - 220  # SCREEN_WIDTH - 220
@@ -179,21 +187,36 @@ def get_slider_x(screen_width):
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Filled background surfaces, reused every frame: {(kind, dark theme, width, height): Surface}
+_background_cache = {}
+
 def draw_widget_background(surface, x, y, width, height):
     """Draw a semi-transparent widget background."""
-    colors = get_colors()
-    bg_color = colors['widget_bg']
-    bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    bg_surface.fill(bg_color)
-    # Draw border
-    border_color = (colors['text_dim'][0], colors['text_dim'][1], colors['text_dim'][2], 100)
-    pygame.draw.rect(bg_surface, border_color, (0, 0, width, height), 1)
-    surface.blit(bg_surface, (x, y))
+    surface.blit(get_widget_background(width, height), (x, y))
+
+def get_widget_background(width, height):
+    """Return the cached widget background surface for the current theme."""
+    key = ('widget', theme.dark, width, height)
+    bg_surface = _background_cache.get(key)
+    if bg_surface is None:
+        colors = get_colors()
+        bg_color = colors['widget_bg']
+        bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        bg_surface.fill(bg_color)
+        # Draw border
+        border_color = (colors['text_dim'][0], colors['text_dim'][1], colors['text_dim'][2], 100)
+        pygame.draw.rect(bg_surface, border_color, (0, 0, width, height), 1)
+        bg_surface = to_display_alpha(bg_surface)
+        _background_cache[key] = bg_surface
+    return bg_surface
 
 def draw_header_background(surface, x, y, width, height, alpha=220):
     """Draw a semi-transparent background for headers."""
-    colors = get_colors()
-    bg_color = colors['top_bar_bg']
-    bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-    bg_surface.fill(bg_color)
+    key = ('header', theme.dark, width, height)
+    bg_surface = _background_cache.get(key)
+    if bg_surface is None:
+        bg_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        bg_surface.fill(get_colors()['top_bar_bg'])
+        bg_surface = to_display_alpha(bg_surface)
+        _background_cache[key] = bg_surface
     surface.blit(bg_surface, (x, y))